@@ -2,25 +2,22 @@
 CAISO Generation Interconnection Queue Dashboard
 """
 import streamlit as st
-import plotly.express as px
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 import pandas as pd
 import os
 import sys
-
-# Import data loader with multiple fallback approaches
-# This handles different environment contexts (local dev, Docker, etc.)
-try:
-    # Try direct import first (same directory)
+from functools import lru_cache
+
+# Import the data loader from the dashboard package, or as a sibling module
+# when run as a script (`streamlit run dashboard/app.py`)
+if __package__:
+    from .data_loader import DataLoader
+else:
+    _dashboard_dir = os.path.dirname(os.path.abspath(__file__))
+    if _dashboard_dir not in sys.path:
+        sys.path.insert(0, _dashboard_dir)
     from data_loader import DataLoader
-except ImportError:
-    try:
-        # Try with current directory in path
-        sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-        from data_loader import DataLoader
-    except ImportError:
-        # Try with absolute import from dashboard package
-        from dashboard.data_loader import DataLoader
 
 # Set page config
 st.set_page_config(
@@ -45,7 +42,38 @@ KPI_OPTIONS = [
     "Data Table"
 ]
 
-@st.cache_resource
+# Chart colors for project statuses
+STATUS_COLORS = {
+    'Active': '#2ecc71',
+    'Completed': '#3498db',
+    'Withdrawn': '#e74c3c'
+}
+
+# Fixed lead time gauge bands as (low, high, color); the last band runs to the axis max
+GAUGE_STEPS_BASE = (
+    (0, 60, "#2ecc71"),
+    (60, 120, "#f1c40f")
+)
+
+# Row limits for the ranked fuel charts
+MAX_FUEL_ROWS = 50
+MAX_DELAY_ROWS = 20
+
+# Columns shown in the top projects chart and table
+TOP_PROJECT_COLUMNS = ['project_name', 'net_mw', 'fuel_types', 'queue_position', 'county', 'state']
+
+# Rows per page in the data table view
+DATA_TABLE_PAGE_SIZE = 100
+
+# In-memory entries kept per disk-persisted query wrapper
+PERSISTED_CACHE_ENTRIES = 64
+
+def _close_loader(loader):
+    """Release a cached loader's prefetch workers and pooled connections"""
+    if loader is not None:
+        loader.close()
+
+@st.cache_resource(on_release=_close_loader)
 def get_data_loader():
     """Create and cache the data loader"""
     try:
@@ -54,33 +82,302 @@ def get_data_loader():
         st.error(f"Database not found: {e}")
         return None
 
-def format_mw(mw_value):
-    """Format MW value as GW if appropriate"""
-    if mw_value >= 1000:
-        return f"{mw_value/1000:.2f} GW"
-    return f"{mw_value:.0f} MW"
+def _study_key():
+    """Return the study process filter as a sorted tuple for use as a cache key"""
+    return tuple(sorted(st.session_state.get('study_process_filter', frozenset())))
+
+def _data_version():
+    """Return the database modification time, which changes on each data refresh"""
+    return get_data_loader().data_version()
+
+# Cached query wrappers. Streamlit reruns the whole script on every widget
+# interaction, so loader results are memoized per study process filter.
+# Filters are passed as sorted tuples so they can be used as cache keys.
+# Results persist to disk across restarts; persisted caches ignore ttl, so
+# each wrapper is keyed on the data version instead, and
+# _prune_persisted_caches deletes the files of older versions.
+@st.cache_data(persist="disk", max_entries=PERSISTED_CACHE_ENTRIES, show_spinner=False)
+def _status_df(data_version, study_key):
+    return get_data_loader().project_count_by_status(study_processes=list(study_key) or None)
+
+@st.cache_data(persist="disk", max_entries=PERSISTED_CACHE_ENTRIES, show_spinner=False)
+def _overview_df(data_version, study_key):
+    return get_data_loader().overview_metrics(study_processes=list(study_key) or None)
+
+@st.cache_data(persist="disk", max_entries=PERSISTED_CACHE_ENTRIES, show_spinner=False)
+def _cancellation_df(data_version, study_key):
+    return get_data_loader().cancellation_rate(study_processes=list(study_key) or None)
+
+@st.cache_data(persist="disk", max_entries=PERSISTED_CACHE_ENTRIES, show_spinner=False)
+def _lead_time_df(data_version, study_key):
+    return get_data_loader().average_lead_time(study_processes=list(study_key) or None)
+
+@st.cache_data(persist="disk", max_entries=PERSISTED_CACHE_ENTRIES, show_spinner=False)
+def _fuel_df(data_version, study_key, fuel_key=()):
+    return get_data_loader().capacity_by_fuel(
+        study_processes=list(study_key) or None, fuel_contains=list(fuel_key) or None
+    )
 
-def create_overview():
-    """Create overview metrics dashboard"""
+@st.cache_data(persist="disk", max_entries=PERSISTED_CACHE_ENTRIES, show_spinner=False)
+def _iso_zones_df(data_version, study_key):
+    return get_data_loader().top5_iso_zones(study_processes=list(study_key) or None)
+
+@st.cache_data(persist="disk", max_entries=PERSISTED_CACHE_ENTRIES, show_spinner=False)
+def _timeline_delay_df(data_version, study_key, fuel_key=()):
+    return get_data_loader().timeline_delay_by_fuel(
+        study_processes=list(study_key) or None, fuel_contains=list(fuel_key) or None
+    )
+
+@st.cache_data(persist="disk", max_entries=PERSISTED_CACHE_ENTRIES, show_spinner=False)
+def _top_projects_df(data_version, study_key, fuel_key=(), limit=10):
+    return get_data_loader().top_projects_by_net_mw(
+        study_processes=list(study_key) or None, fuel_contains=list(fuel_key) or None, limit=limit
+    )
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _prefetch_reports(data_version, study_key):
+    """Start the dashboard reports in the background once per data version and filter
+
+    Results land in the loader's report cache; nothing is kept here.
+    """
+    get_data_loader().prefetch_dashboard(study_processes=list(study_key) or None)
+
+@st.cache_data(persist="disk", max_entries=PERSISTED_CACHE_ENTRIES, show_spinner=False)
+def _cluster15_summary(data_version):
+    return get_data_loader().get_cluster15_summary()
+
+@st.cache_data(persist="disk", max_entries=PERSISTED_CACHE_ENTRIES, show_spinner=False)
+def _cluster15_fuel_df(data_version):
+    return get_data_loader().get_cluster15_capacity_by_fuel()
+
+@st.cache_data(persist="disk", max_entries=PERSISTED_CACHE_ENTRIES, show_spinner=False)
+def _cluster15_projects_df(data_version):
+    return get_data_loader().get_cluster15_projects()
+
+@st.cache_data(persist="disk", max_entries=PERSISTED_CACHE_ENTRIES, show_spinner=False)
+def _study_process_labels(data_version):
+    """Map each study process, in display order, to a descriptive label"""
+    study_process_labels = {}
+    for sp in get_data_loader().get_study_processes():
+        if sp.startswith('C') and len(sp) > 1 and sp[1:].isdigit():
+            study_process_labels[sp] = f"{sp} (Cluster {sp[1:]})"
+        elif sp == 'Serial LGIP':
+            study_process_labels[sp] = f"{sp} (Standard LGIP)"
+        elif sp == 'TC':
+            study_process_labels[sp] = f"{sp} (Transition Cluster)"
+        elif sp == 'ISP':
+            study_process_labels[sp] = f"{sp} (Independent Study Process)"
+        elif sp == 'FT':
+            study_process_labels[sp] = f"{sp} (Fast Track)"
+        elif sp.startswith('SGIP'):
+            study_process_labels[sp] = f"{sp} (Small Generator)"
+        else:
+            study_process_labels[sp] = sp
+    return study_process_labels
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _latest_ingestion_date():
+    return get_data_loader().get_latest_ingestion_date()
+
+@st.cache_data(persist="disk", max_entries=PERSISTED_CACHE_ENTRIES, show_spinner=False)
+def _locations_agg(data_version, status):
+    """Aggregate project locations by county with precomputed hover text"""
+    agg_df = get_data_loader().get_project_locations(status=status, county_only=True)
+    if agg_df.empty:
+        return agg_df
+    agg_df['hover_text'] = (
+        agg_df['county'].astype(str) + ' County, ' + agg_df['state'].astype(str) +
+        '<br>Projects: ' + agg_df['project_count'].astype(str) +
+        '<br>Total Capacity: ' + agg_df['total_capacity'].map(format_mw)
+    )
+    return agg_df
+
+@st.cache_data(persist="disk", max_entries=PERSISTED_CACHE_ENTRIES, show_spinner=False)
+def _table_filter_options(data_version, status_key, study_key):
+    """Distinct fuel, county and state options for the data table sidebar"""
     loader = get_data_loader()
-    if not loader:
+    study_processes = list(study_key) or None
+    fuel_types = loader.get_distinct_values('fuel_types', status=status_key, study_processes=study_processes)
+    return {
+        'fuels': fuel_token_universe(tuple(fuel_types)),
+        'counties': loader.get_distinct_values('county', status=status_key, study_processes=study_processes),
+        'states': loader.get_distinct_values('state', status=status_key, study_processes=study_processes)
+    }
+
+@st.cache_data(persist="disk", show_spinner=False)
+def _persisted_data_version():
+    """Data version the persisted query caches were built from, kept across restarts"""
+    return _data_version()
+
+PERSISTED_WRAPPERS = (
+    _status_df, _overview_df, _cancellation_df, _lead_time_df, _fuel_df, _iso_zones_df,
+    _timeline_delay_df, _top_projects_df, _cluster15_summary, _cluster15_fuel_df,
+    _cluster15_projects_df, _study_process_labels, _locations_agg, _table_filter_options
+)
+
+def _prune_persisted_caches():
+    """Delete persisted query results once the data version changes
+
+    Disk caches are never evicted by Streamlit, so without this every data
+    refresh would leave another set of pickles behind.
+    """
+    if _persisted_data_version() == _data_version():
         return
+    for wrapper in PERSISTED_WRAPPERS:
+        wrapper.clear()
+    _persisted_data_version.clear()
+    _persisted_data_version()
+
+@st.cache_data(show_spinner=False)
+def _to_csv_bytes(df):
+    """Serialize a DataFrame to CSV bytes, memoized on the frame's contents"""
+    return df.to_csv(index=False).encode('utf-8')
+
+@st.cache_data(show_spinner=False)
+def fuel_token_universe(fuels):
+    """Return the sorted distinct tokens of '/'-separated fuel strings
+
+    Args:
+        fuels (tuple): Fuel strings such as 'Solar/Battery'
+    """
+    tokens = pd.Series(fuels, dtype=object).dropna().astype(str).str.split('/').explode().str.strip()
+    return sorted(tokens[tokens != ''].unique().tolist())
+
+# Figure builders are memoized on their input frame and arguments so reruns
+# reuse the figure spec, and charts are rendered with stable keys.
+# Streamlit already loads plotly.graph_objects; plotly.express adds ~0.1 s of
+# imports, so it is imported inside the builders that use it.
+@st.cache_data(max_entries=32, show_spinner=False)
+def _bar_fig(df, x, y, title, xaxis_title, yaxis_title, color=None,
+             hover_data=None, tickangle=None):
+    """Build a bar chart figure"""
+    import plotly.express as px
+
+    fig = px.bar(
+        df,
+        x=x,
+        y=y,
+        color=color,
+        title=title,
+        hover_data=hover_data
+    )
+    fig.update_layout(xaxis_title=xaxis_title, yaxis_title=yaxis_title)
+    if tickangle is not None:
+        fig.update_xaxes(tickangle=tickangle)
+    return fig
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _pie_fig(df, values, names, title):
+    """Build a pie chart figure labelled inside each slice"""
+    import plotly.express as px
+
+    fig = px.pie(
+        df,
+        values=values,
+        names=names,
+        title=title
+    )
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    return fig
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _status_breakdown_fig(df, pie_title, bar_title):
+    """Build the project count pie and capacity bar by status as one figure"""
+    statuses = df['status'].astype(str)
+    colors = statuses.map(STATUS_COLORS).tolist()
+    fig = make_subplots(
+        rows=1,
+        cols=2,
+        specs=[[{'type': 'domain'}, {'type': 'xy'}]],
+        subplot_titles=(pie_title, bar_title)
+    )
+    fig.add_trace(
+        go.Pie(
+            labels=statuses,
+            values=df['project_count'],
+            marker=dict(colors=colors),
+            textposition='inside',
+            textinfo='percent+label',
+            sort=False
+        ),
+        row=1, col=1
+    )
+    fig.add_trace(
+        go.Bar(x=statuses, y=df['total_mw'], marker_color=colors, showlegend=False),
+        row=1, col=2
+    )
+    fig.update_xaxes(title_text="Status", row=1, col=2)
+    fig.update_yaxes(title_text="Capacity (MW)", row=1, col=2)
+    return fig
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _lead_time_gauge(avg_lead_time):
+    """Build the average lead time gauge figure"""
+    gauge_max = max(180, avg_lead_time * 1.5)
+    return go.Figure(go.Indicator(
+        mode = "gauge+number",
+        value = avg_lead_time,
+        title = {'text': "Average Lead Time (days)"},
+        gauge = {
+            'axis': {'range': [0, gauge_max]},
+            'bar': {'color': "#1f77b4"},
+            'steps': [{'range': [low, high], 'color': color} for low, high, color in GAUGE_STEPS_BASE] + [
+                {'range': [120, gauge_max], 'color': "#e74c3c"}
+            ]
+        }
+    ))
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _locations_map_fig(data_version, status, status_label):
+    """Build the county project map for a status filter"""
+    import plotly.express as px
+
+    fig = px.scatter_map(
+        _locations_agg(data_version, status),
+        lat='latitude',
+        lon='longitude',
+        hover_name='hover_text',
+        size='project_count',
+        color='total_capacity',
+        color_continuous_scale='Viridis',
+        size_max=15,
+        zoom=4
+    )
+    
+    fig.update_layout(
+        title=f"Project Locations by County ({status_label} Projects)",
+        # scatter_map renders through MapLibre GL (WebGL), so large marker
+        # counts stay off the SVG path; it is configured via layout.map
+        map=dict(
+            center=dict(lat=37.7749, lon=-122.4194),  # Center on California
+            zoom=5,
+            style="carto-positron"
+        ),
+        margin=dict(l=0, r=0, t=30, b=0),
+        uirevision='project_map'  # keep pan/zoom across reruns
+    )
+    return fig
 
-    # Get study process filter from session state
-    study_filter = st.session_state.get('study_process_filter', []) or None
+@lru_cache(maxsize=512)
+def format_mw(mw_value):
+    """Format MW value as GW if appropriate"""
+    return f"{mw_value/1000:.2f} GW" if mw_value >= 1000 else f"{mw_value:.0f} MW"
 
-    # Get key metrics with study cluster filter applied
-    status_df = loader.project_count_by_status(study_processes=study_filter)
-    cancellation_df = loader.cancellation_rate(study_processes=study_filter)
-    lead_time_df = loader.average_lead_time(study_processes=study_filter)
+def create_overview(loader, study_key):
+    """Create overview metrics dashboard"""
+    # Get key metrics with study cluster filter applied, in a single query
+    status_df = _overview_df(_data_version(), study_key)
     
-    # Extract metrics
-    active_count = status_df[status_df['status'] == 'Active']['project_count'].iloc[0]
-    active_mw = status_df[status_df['status'] == 'Active']['total_mw'].iloc[0]
-    completed_count = status_df[status_df['status'] == 'Completed']['project_count'].iloc[0]
-    completed_mw = status_df[status_df['status'] == 'Completed']['total_mw'].iloc[0]
-    cancellation_rate = cancellation_df['cancellation_rate'].iloc[0]
-    avg_lead_time = lead_time_df['average_lead_time_days'].iloc[0]
+    # Extract metrics via a single status index lookup
+    by_status = status_df.set_index('status')
+    counts = by_status['project_count']
+    capacities = by_status['total_mw']
+    active_count = int(counts.get('Active', 0))
+    active_mw = float(capacities.get('Active', 0))
+    completed_count = int(counts.get('Completed', 0))
+    completed_mw = float(capacities.get('Completed', 0))
+    cancellation_rate = status_df['cancellation_rate'].iloc[0]
+    avg_lead_time = status_df['average_lead_time_days'].iloc[0]
     
     # Create metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -92,61 +389,25 @@ def create_overview():
         st.metric("Completed Capacity", format_mw(completed_mw))
     with col3:
         st.metric("Cancellation Rate", f"{cancellation_rate:.1%}")
-        total_projects = active_count + completed_count + status_df[status_df['status'] == 'Withdrawn']['project_count'].iloc[0]
+        total_projects = int(counts.sum())
         st.metric("Total Projects", f"{total_projects:,}")
     with col4:
         st.metric("Avg. Lead Time", f"{avg_lead_time:.1f} days")
-        total_mw = status_df['total_mw'].sum()
+        total_mw = float(capacities.sum())
         st.metric("Total Capacity", format_mw(total_mw))
     
-    # Create two charts side by side
-    col1, col2 = st.columns(2)
-    
-    # Project count by status
-    with col1:
-        fig1 = px.pie(
-            status_df, 
-            values='project_count', 
-            names='status',
-            title='Project Count by Status',
-            color='status',
-            color_discrete_map={
-                'Active': '#2ecc71', 
-                'Completed': '#3498db', 
-                'Withdrawn': '#e74c3c'
-            }
-        )
-        fig1.update_traces(textposition='inside', textinfo='percent+label')
-        st.plotly_chart(fig1, use_container_width=True)
-    
-    # Capacity by status
-    with col2:
-        fig2 = px.bar(
-            status_df, 
-            x='status', 
-            y='total_mw',
-            title='Capacity by Status (MW)',
-            color='status',
-            color_discrete_map={
-                'Active': '#2ecc71', 
-                'Completed': '#3498db', 
-                'Withdrawn': '#e74c3c'
-            }
-        )
-        fig2.update_yaxes(title_text='Capacity (MW)')
-        st.plotly_chart(fig2, use_container_width=True)
+    # Project count and capacity by status, side by side in one figure
+    fig = _status_breakdown_fig(
+        status_df,
+        pie_title='Project Count by Status',
+        bar_title='Capacity by Status (MW)'
+    )
+    st.plotly_chart(fig, use_container_width=True, key='overview_status_breakdown')
 
-def show_capacity_by_fuel():
+def show_capacity_by_fuel(loader, study_key):
     """Show capacity by fuel type visualization"""
-    loader = get_data_loader()
-    if not loader:
-        return
-
-    # Get study process filter from session state
-    study_filter = st.session_state.get('study_process_filter', []) or None
-
     try:
-        df = loader.capacity_by_fuel(study_processes=study_filter)
+        df = _fuel_df(_data_version(), study_key)
         
         # Check if dataframe is empty or has the expected columns
         if df is None or df.empty or 'fuel' not in df.columns or 'total_mw' not in df.columns:
@@ -154,25 +415,19 @@ def show_capacity_by_fuel():
             return
         
         # Create options for filtering
-        fuel_categories = []
-        for fuel in df['fuel']:
-            for f in fuel.split('/'):
-                if f not in fuel_categories:
-                    fuel_categories.append(f)
-        
         fuel_filter = st.multiselect(
             "Filter by fuel type (contains):",
-            options=sorted(fuel_categories),
+            options=fuel_token_universe(tuple(df['fuel'])),
             default=[]
         )
         
         # Apply filters
         filtered_df = df
         if fuel_filter:
-            filtered_df = df[df['fuel'].apply(lambda x: any(f in x for f in fuel_filter))]
+            filtered_df = _fuel_df(_data_version(), study_key, tuple(sorted(fuel_filter)))
             
-        # Sort by capacity
-        filtered_df = filtered_df.sort_values('total_mw', ascending=False)
+        # Rows arrive sorted by capacity; keep the largest fuel groups
+        filtered_df = filtered_df.head(MAX_FUEL_ROWS)
         
         # Create visualization
         st.subheader("Capacity by Fuel Type")
@@ -192,19 +447,17 @@ def show_capacity_by_fuel():
         
         with col2:
             try:
-                fig = px.bar(
+                fig = _bar_fig(
                     filtered_df,
                     x='fuel',
                     y='total_mw',
-                    color='fuel',
-                    title='Generation Capacity by Fuel Type'
-                )
-                fig.update_layout(
+                    title='Generation Capacity by Fuel Type',
                     xaxis_title="Fuel Type",
                     yaxis_title="Capacity (MW)",
-                    xaxis=dict(tickangle=45)
+                    color='fuel',
+                    tickangle=45
                 )
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(fig, use_container_width=True, key='fuel_capacity_bar')
             except Exception as e:
                 st.error(f"Error creating fuel capacity visualization: {str(e)}")
     except Exception as e:
@@ -212,65 +465,30 @@ def show_capacity_by_fuel():
     
     # Additional visualization - Pie chart
     try:
-        fig2 = px.pie(
+        fig2 = _pie_fig(
             filtered_df,
             values='total_mw',
             names='fuel',
             title='Capacity Distribution by Fuel Type'
         )
-        fig2.update_traces(textposition='inside', textinfo='percent+label')
-        st.plotly_chart(fig2, use_container_width=True)
+        st.plotly_chart(fig2, use_container_width=True, key='fuel_capacity_pie')
     except Exception as e:
         st.error(f"Error creating fuel distribution visualization: {str(e)}")
 
-def show_project_status():
+def show_project_status(loader, study_key):
     """Show project status visualization"""
-    loader = get_data_loader()
-    if not loader:
-        return
-
-    # Get study process filter from session state
-    study_filter = st.session_state.get('study_process_filter', []) or None
-
     try:
-        df = loader.project_count_by_status(study_processes=study_filter)
+        df = _status_df(_data_version(), study_key)
         
         # Create visualizations
         st.subheader("Project Status")
         
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig1 = px.pie(
-                df, 
-                values='project_count', 
-                names='status',
-                title='Project Count by Status',
-                color='status',
-                color_discrete_map={
-                    'Active': '#2ecc71', 
-                    'Completed': '#3498db', 
-                    'Withdrawn': '#e74c3c'
-                }
-            )
-            fig1.update_traces(textposition='inside', textinfo='percent+label')
-            st.plotly_chart(fig1, use_container_width=True)
-        
-        with col2:
-            fig2 = px.bar(
-                df, 
-                x='status', 
-                y='total_mw',
-                title='Total Capacity by Status (MW)',
-                color='status',
-                color_discrete_map={
-                    'Active': '#2ecc71', 
-                    'Completed': '#3498db', 
-                    'Withdrawn': '#e74c3c'
-                }
-            )
-            fig2.update_layout(xaxis_title="Status", yaxis_title="Capacity (MW)")
-            st.plotly_chart(fig2, use_container_width=True)
+        fig = _status_breakdown_fig(
+            df,
+            pie_title='Project Count by Status',
+            bar_title='Total Capacity by Status (MW)'
+        )
+        st.plotly_chart(fig, use_container_width=True, key='status_breakdown')
         
         # Additional metrics
         total_projects = df['project_count'].sum()
@@ -280,23 +498,16 @@ def show_project_status():
         st.metric("Total Capacity", format_mw(total_capacity))
 
         # Cancellation rate with study filter applied
-        cancellation_df = loader.cancellation_rate(study_processes=study_filter)
+        cancellation_df = _cancellation_df(_data_version(), study_key)
         rate = cancellation_df['cancellation_rate'].iloc[0]
         st.metric("Cancellation Rate", f"{rate:.1%}")
     except Exception as e:
         st.error(f"Error in project status visualization: {str(e)}")
 
-def show_top_iso_zones():
+def show_top_iso_zones(loader, study_key):
     """Show top ISO zones visualization"""
-    loader = get_data_loader()
-    if not loader:
-        return
-
-    # Get study process filter from session state
-    study_filter = st.session_state.get('study_process_filter', []) or None
-
     try:
-        df = loader.top5_iso_zones(study_processes=study_filter)
+        df = _iso_zones_df(_data_version(), study_key)
         
         # Check if dataframe is empty or has the expected columns
         if df is None or df.empty or 'iso_zone' not in df.columns or 'total_mw' not in df.columns:
@@ -308,19 +519,17 @@ def show_top_iso_zones():
         
         # Create the Plotly figure with error handling
         try:
-            fig = px.bar(
+            fig = _bar_fig(
                 df,
                 x='iso_zone',
                 y='total_mw',
-                color='iso_zone',
-                title='Top 5 ISO Zones by Generation Capacity'
-            )
-            fig.update_layout(
-                xaxis_title="ISO Zone", 
+                title='Top 5 ISO Zones by Generation Capacity',
+                xaxis_title="ISO Zone",
                 yaxis_title="Capacity (MW)",
-                xaxis=dict(tickangle=45)
+                color='iso_zone',
+                tickangle=45
             )
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, use_container_width=True, key='iso_zones_bar')
         except Exception as e:
             st.error(f"Error creating ISO zones visualization: {str(e)}")
             
@@ -336,39 +545,19 @@ def show_top_iso_zones():
     except Exception as e:
         st.error(f"Error loading ISO zones data: {str(e)}")
 
-def show_lead_time_analysis():
+def show_lead_time_analysis(loader, study_key):
     """Show lead time analysis"""
-    loader = get_data_loader()
-    if not loader:
-        return
-
-    # Get study process filter from session state
-    study_filter = st.session_state.get('study_process_filter', []) or None
-
     try:
-        lead_time_df = loader.average_lead_time(study_processes=study_filter)
+        lead_time_df = _lead_time_df(_data_version(), study_key)
         avg_lead_time = lead_time_df['average_lead_time_days'].iloc[0]
         
         st.subheader("Interconnection Request Lead Time")
         st.metric("Average Lead Time", f"{avg_lead_time:.1f} days")
         
         # Create a gauge chart for lead time
-        fig = go.Figure(go.Indicator(
-            mode = "gauge+number",
-            value = avg_lead_time,
-            title = {'text': "Average Lead Time (days)"},
-            gauge = {
-                'axis': {'range': [0, max(180, avg_lead_time * 1.5)]},
-                'bar': {'color': "#1f77b4"},
-                'steps': [
-                    {'range': [0, 60], 'color': "#2ecc71"},
-                    {'range': [60, 120], 'color': "#f1c40f"},
-                    {'range': [120, max(180, avg_lead_time * 1.5)], 'color': "#e74c3c"}
-                ]
-            }
-        ))
+        fig = _lead_time_gauge(float(avg_lead_time))
         
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, key='lead_time_gauge')
         
         st.info(
             "Lead time is measured as the number of days between when an " +
@@ -377,17 +566,10 @@ def show_lead_time_analysis():
     except Exception as e:
         st.error(f"Error in lead time analysis: {str(e)}")
 
-def show_timeline_delays():
+def show_timeline_delays(loader, study_key):
     """Show timeline delays visualization"""
-    loader = get_data_loader()
-    if not loader:
-        return
-
-    # Get study process filter from session state
-    study_filter = st.session_state.get('study_process_filter', []) or None
-
     try:
-        df = loader.timeline_delay_by_fuel(study_processes=study_filter)
+        df = _timeline_delay_df(_data_version(), study_key)
         
         # Check if dataframe is empty or has the expected columns
         if df is None or df.empty or 'fuel' not in df.columns or 'avg_delay_days' not in df.columns:
@@ -398,40 +580,32 @@ def show_timeline_delays():
         st.subheader("Project Timeline Delays by Fuel Type")
         
         # Create options for filtering
-        fuel_categories = []
-        for fuel in df['fuel']:
-            for f in fuel.split('/'):
-                if f not in fuel_categories:
-                    fuel_categories.append(f)
-        
         fuel_filter = st.multiselect(
             "Filter by fuel type (contains):",
-            options=sorted(fuel_categories),
+            options=fuel_token_universe(tuple(df['fuel'])),
             default=[]
         )
         
         # Apply filters
         filtered_df = df
         if fuel_filter:
-            filtered_df = df[df['fuel'].apply(lambda x: any(f in x for f in fuel_filter))]
+            filtered_df = _timeline_delay_df(_data_version(), study_key, tuple(sorted(fuel_filter)))
         
-        # Sort by delay
-        filtered_df = filtered_df.sort_values('avg_delay_days', ascending=False)
+        # Rows arrive sorted by delay; keep the longest delays
+        filtered_df = filtered_df.head(MAX_DELAY_ROWS)
         
         try:
-            fig = px.bar(
+            fig = _bar_fig(
                 filtered_df,
                 x='fuel',
                 y='avg_delay_days',
-                color='fuel',
-                title='Average Timeline Delay by Fuel Type (days)'
-            )
-            fig.update_layout(
-                xaxis_title="Fuel Type", 
+                title='Average Timeline Delay by Fuel Type (days)',
+                xaxis_title="Fuel Type",
                 yaxis_title="Average Delay (days)",
-                xaxis=dict(tickangle=45)
+                color='fuel',
+                tickangle=45
             )
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, use_container_width=True, key='timeline_delay_bar')
         except Exception as e:
             st.error(f"Error creating timeline delay visualization: {str(e)}")
         
@@ -447,22 +621,16 @@ def show_timeline_delays():
         
         st.info(
             "Timeline delay is measured as the difference in days between " +
-            "the planned online date and the actual online date."
+            "the originally proposed online date and the current online date."
         )
     except Exception as e:
         st.error(f"Timeline delay data is not available: {str(e)}")
 
-def show_top_projects():
+def show_top_projects(loader, study_key):
     """Show top projects visualization"""
-    loader = get_data_loader()
-    if not loader:
-        return
-
-    # Get study process filter from session state
-    study_filter = st.session_state.get('study_process_filter', []) or None
-
     try:
-        df = loader.top_projects_by_net_mw(study_processes=study_filter)
+        top_n = st.slider("Show top N projects", min_value=5, max_value=50, value=10)
+        df = _top_projects_df(_data_version(), study_key, limit=top_n)
         
         # Check if dataframe is empty or has the expected columns
         if df is None or df.empty or 'project_name' not in df.columns or 'net_mw' not in df.columns or 'fuel_types' not in df.columns:
@@ -473,39 +641,34 @@ def show_top_projects():
         st.subheader("Top Projects by Net MW")
         
         # Add filtering options
-        fuel_types = []
-        for fuel in df['fuel_types']:
-            for f in str(fuel).split('/'):
-                if f not in fuel_types:
-                    fuel_types.append(f)
-        
         fuel_filter = st.multiselect(
             "Filter by fuel type (contains):",
-            options=sorted(fuel_types),
+            options=fuel_token_universe(tuple(df['fuel_types'])),
             default=[]
         )
         
         # Apply filters
         filtered_df = df
         if fuel_filter:
-            filtered_df = df[df['fuel_types'].apply(lambda x: any(f in str(x) for f in fuel_filter))]
+            filtered_df = _top_projects_df(_data_version(), study_key, tuple(sorted(fuel_filter)), top_n)
+        
+        # Only the displayed columns are sent to the chart and table
+        filtered_df = filtered_df[[col for col in TOP_PROJECT_COLUMNS if col in filtered_df.columns]]
         
         try:
             # Bar chart for top projects
-            fig = px.bar(
+            fig = _bar_fig(
                 filtered_df,
                 x='project_name',
                 y='net_mw',
-                color='fuel_types',
                 title='Top Projects by Net MW Contribution',
-                hover_data=['queue_position', 'county', 'state']
-            )
-            fig.update_layout(
-                xaxis_title="Project", 
+                xaxis_title="Project",
                 yaxis_title="Net MW",
-                xaxis=dict(tickangle=45)
+                color='fuel_types',
+                hover_data=['queue_position', 'county', 'state'],
+                tickangle=45
             )
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, use_container_width=True, key='top_projects_bar')
         except Exception as e:
             st.error(f"Error creating top projects visualization: {str(e)}")
             
@@ -525,12 +688,8 @@ def show_top_projects():
     except Exception as e:
         st.error(f"Error loading top projects data: {str(e)}")
 
-def show_project_map():
+def show_project_map(loader, study_key):
     """Show map visualization of projects by county and state"""
-    loader = get_data_loader()
-    if not loader:
-        return
-    
     st.subheader("Project Locations Map")
     
     # Add status filter
@@ -542,53 +701,18 @@ def show_project_map():
     
     # Get data with status filter
     status = status_filter.lower() if status_filter != 'All' else 'all'
-    df = loader.get_project_locations(status=status)
+    # Locations aggregated by county and state
+    agg_df = _locations_agg(_data_version(), status)
     
-    if df.empty:
+    if agg_df.empty:
         st.warning("No project location data available.")
         return
     
-    # Aggregate data by county and state
-    agg_df = df.groupby(['county', 'state', 'latitude', 'longitude']).agg({
-        'project_name': 'count',
-        'capacity': 'sum'
-    }).reset_index()
-    
-    agg_df.columns = ['county', 'state', 'latitude', 'longitude', 'project_count', 'total_capacity']
-    
-    # Create hover text
-    agg_df['hover_text'] = agg_df.apply(
-        lambda x: f"{x['county']} County, {x['state']}<br>" +
-                 f"Projects: {x['project_count']}<br>" +
-                 f"Total Capacity: {format_mw(x['total_capacity'])}",
-        axis=1
-    )
-    
     # Create the map using scatter_map
-    fig = px.scatter_map(
-        agg_df,
-        lat='latitude',
-        lon='longitude',
-        hover_name='hover_text',
-        size='project_count',
-        color='total_capacity',
-        color_continuous_scale='Viridis',
-        size_max=15,
-        zoom=4
-    )
-    
-    fig.update_layout(
-        title=f"Project Locations by County ({status_filter} Projects)",
-        mapbox=dict(
-            center=dict(lat=37.7749, lon=-122.4194),  # Center on California
-            zoom=5,
-            style="carto-positron"
-        ),
-        margin=dict(l=0, r=0, t=30, b=0)
-    )
+    fig = _locations_map_fig(_data_version(), status, status_filter)
     
     # Display the map
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True, key='project_map')
     
     # Add some spacing
     st.markdown("---")
@@ -622,72 +746,10 @@ def show_project_map():
             hide_index=True
         )
 
-def create_cluster15_view():
-    """Create the Cluster 15 Interconnection Requests view."""
-    loader = get_data_loader()
-    if not loader:
-        return
-
-    st.header("Cluster 15 Interconnection Requests")
-    st.caption(
-        "Data sourced from CAISO's Cluster 15 Interconnection Requests publication. "
-        "This is a dedicated cluster study dataset separate from the weekly Public Queue Report."
-    )
-
-    summary = loader.get_cluster15_summary()
-
-    if summary['total_projects'] == 0:
-        st.warning(
-            "No Cluster 15 data found in the database. "
-            "Run the pipeline to download and ingest the Cluster 15 file."
-        )
-        return
-
-    col1, col2 = st.columns(2)
-    with col1:
-        st.metric("Cluster 15 Projects", f"{summary['total_projects']:,}")
-    with col2:
-        mw = summary['total_mw']
-        st.metric("Cluster 15 Total Capacity", format_mw(mw) if mw else "N/A")
-
-    st.divider()
-
-    fuel_df = loader.get_cluster15_capacity_by_fuel()
-    if not fuel_df.empty:
-        st.subheader("Capacity by Fuel Type")
-        fig = px.bar(
-            fuel_df,
-            x='fuel',
-            y='total_mw',
-            title="Cluster 15 — Capacity by Fuel Type",
-            labels={'fuel': 'Fuel Type', 'total_mw': 'Total MW'},
-            color='fuel'
-        )
-        st.plotly_chart(fig, use_container_width=True)
-
-    st.divider()
-
-    st.subheader("All Cluster 15 Projects")
-    projects_df = loader.get_cluster15_projects()
-    if not projects_df.empty:
-        display_cols = [c for c in [
-            'queue_position', 'project_name', 'fuel_types', 'net_mw',
-            'county', 'state', 'application_status', 'study_process',
-            'proposed_online_date', 'current_online_date'
-        ] if c in projects_df.columns]
-        st.dataframe(projects_df[display_cols], use_container_width=True)
-    else:
-        st.info("No project records available.")
-
-
-def show_data_table():
+def show_data_table(loader, study_key):
     """Show interactive data table with filtering capabilities"""
-    loader = get_data_loader()
-    if not loader:
-        return
-
     # Check if loader has the required method
-    if not hasattr(loader, 'get_all_projects'):
+    if not hasattr(loader, 'query_projects'):
         st.error(
             "⚠️ Data loader needs to be updated. Please reload the application.\n\n"
             "**If running locally:** Restart the Streamlit server.\n\n"
@@ -714,11 +776,10 @@ def show_data_table():
     # Get data based on status filter
     status_key = status_filter.lower() if status_filter != 'All' else 'all'
 
-    # Get study process filter from session state
-    study_filter = st.session_state.get('study_process_filter', []) or None
+    study_filter = list(study_key) or None
 
     try:
-        df = loader.get_all_projects(table=status_key, study_processes=study_filter)
+        all_columns = loader.get_project_columns(status=status_key)
     except Exception as e:
         st.error(f"Error loading data: {str(e)}")
         st.info("Try clearing the cache and reloading the page.")
@@ -727,13 +788,6 @@ def show_data_table():
             st.rerun()
         return
 
-    if df.empty:
-        st.warning("No data available.")
-        return
-
-    # Get all column names
-    all_columns = list(df.columns)
-
     # Important columns to show by default
     default_columns = [
         'project_name', 'queue_position', 'study_process', 'county', 'state',
@@ -753,58 +807,36 @@ def show_data_table():
     if not selected_columns:
         selected_columns = default_columns
 
-    # Apply column selection
-    df_display = df[selected_columns].copy()
-
-    # Fuel type filter (if fuel_types column exists)
-    if 'fuel_types' in df.columns:
-        fuel_types = set()
-        for fuel in df['fuel_types'].dropna():
-            for f in str(fuel).split('/'):
-                fuel_types.add(f.strip())
+    # Collect all filter values first; they are applied in SQL by the loader
+    filter_options = _table_filter_options(_data_version(), status_key, study_key)
 
+    fuel_filter = []
+    if 'fuel_types' in all_columns:
         fuel_filter = st.sidebar.multiselect(
             "Filter by Fuel Type:",
-            options=sorted(fuel_types),
+            options=filter_options['fuels'],
             default=[]
         )
 
-        if fuel_filter:
-            df_display = df_display[df['fuel_types'].apply(
-                lambda x: any(f in str(x) for f in fuel_filter) if pd.notna(x) else False
-            )]
-
-    # County filter (if county column exists)
-    if 'county' in df.columns:
-        counties = sorted(df['county'].dropna().unique())
+    county_filter = []
+    if 'county' in all_columns:
         county_filter = st.sidebar.multiselect(
             "Filter by County:",
-            options=counties,
+            options=filter_options['counties'],
             default=[]
         )
 
-        if county_filter:
-            df_display = df_display[df['county'].isin(county_filter)]
-
-    # State filter (if state column exists)
-    if 'state' in df.columns:
-        states = sorted(df['state'].dropna().unique())
+    state_filter = []
+    if 'state' in all_columns:
         state_filter = st.sidebar.multiselect(
             "Filter by State:",
-            options=states,
+            options=filter_options['states'],
             default=[]
         )
 
-        if state_filter:
-            df_display = df_display[df['state'].isin(state_filter)]
-
-    # Capacity filter (if net_mw or mw_1 exists)
-    capacity_col = None
-    if 'net_mw' in df.columns:
-        capacity_col = 'net_mw'
-    elif 'mw_1' in df.columns:
-        capacity_col = 'mw_1'
-
+    # Capacity filter (if net_mw exists)
+    capacity_col = 'net_mw' if 'net_mw' in all_columns else None
+    min_capacity = 0.0
     if capacity_col:
         min_capacity = st.sidebar.number_input(
             "Minimum Capacity (MW):",
@@ -813,15 +845,23 @@ def show_data_table():
             step=10.0
         )
 
-        if min_capacity > 0:
-            df_display = df_display[df[capacity_col].fillna(0) >= min_capacity]
-
     # Text search
     search_term = st.sidebar.text_input("Search in Project Names:", "")
-    if search_term and 'project_name' in df.columns:
-        df_display = df_display[df['project_name'].str.contains(
-            search_term, case=False, na=False
-        )]
+
+    df_display = loader.query_projects(
+        status=status_key,
+        study_processes=study_filter,
+        counties=county_filter,
+        states=state_filter,
+        fuel_tokens=fuel_filter,
+        min_capacity=min_capacity,
+        name_search=search_term,
+        columns=selected_columns
+    )
+
+    if len(df_display.columns) == 0:
+        st.warning("No data available.")
+        return
 
     # Display summary metrics
     col1, col2, col3 = st.columns(3)
@@ -858,9 +898,13 @@ def show_data_table():
             "Longitude", format="%.6f"
         )
 
-    # Display table with pagination
+    # Display table with pagination; only the current page is sent to the browser
+    page_count = max((len(df_display) + DATA_TABLE_PAGE_SIZE - 1) // DATA_TABLE_PAGE_SIZE, 1)
+    page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+    st.caption(f"Page {page} of {page_count}")
+    start = (page - 1) * DATA_TABLE_PAGE_SIZE
     st.dataframe(
-        df_display,
+        df_display.iloc[start:start + DATA_TABLE_PAGE_SIZE],
         column_config=column_config,
         hide_index=True,
         use_container_width=True,
@@ -868,28 +912,23 @@ def show_data_table():
     )
 
     # Download button
-    csv = df_display.to_csv(index=False).encode('utf-8')
     st.download_button(
         label="Download Filtered Data as CSV",
-        data=csv,
+        data=_to_csv_bytes(df_display),
         file_name=f"caiso_projects_{status_filter.lower()}.csv",
         mime="text/csv"
     )
 
 
-def create_cluster15_view():
+def create_cluster15_view(loader, study_key):
     """Create the Cluster 15 Interconnection Requests dedicated view."""
-    loader = get_data_loader()
-    if not loader:
-        return
-
     st.header("Cluster 15 Interconnection Requests")
     st.caption(
         "Data sourced from CAISO's Cluster 15 Interconnection Requests publication. "
         "This is a dedicated cluster study dataset separate from the weekly Public Queue Report."
     )
 
-    summary = loader.get_cluster15_summary()
+    summary = _cluster15_summary(_data_version())
 
     if summary['total_projects'] == 0:
         st.warning(
@@ -907,23 +946,24 @@ def create_cluster15_view():
 
     st.divider()
 
-    fuel_df = loader.get_cluster15_capacity_by_fuel()
+    fuel_df = _cluster15_fuel_df(_data_version())
     if not fuel_df.empty:
         st.subheader("Capacity by Fuel Type")
-        fig = px.bar(
+        fig = _bar_fig(
             fuel_df,
             x='fuel',
             y='total_mw',
             title="Cluster 15 — Capacity by Fuel Type",
-            labels={'fuel': 'Fuel Type', 'total_mw': 'Total MW'},
+            xaxis_title='Fuel Type',
+            yaxis_title='Total MW',
             color='fuel'
         )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, key='cluster15_fuel_bar')
 
     st.divider()
 
     st.subheader("All Cluster 15 Projects")
-    projects_df = loader.get_cluster15_projects()
+    projects_df = _cluster15_projects_df(_data_version())
     if not projects_df.empty:
         display_cols = [c for c in [
             'queue_position', 'project_name', 'fuel_types', 'net_mw',
@@ -935,6 +975,20 @@ def create_cluster15_view():
         st.info("No project records available.")
 
 
+# Views keyed by their sidebar label; each takes the loader and study key
+KPI_VIEWS = {
+    "Overview": create_overview,
+    "Capacity by Fuel Type": show_capacity_by_fuel,
+    "Project Status": show_project_status,
+    "Top ISO Zones": show_top_iso_zones,
+    "Lead Time Analysis": show_lead_time_analysis,
+    "Timeline Delays": show_timeline_delays,
+    "Top Projects": show_top_projects,
+    "Project Map": show_project_map,
+    "Cluster 15": create_cluster15_view,
+    "Data Table": show_data_table
+}
+
 def main():
     """Main function to render the Streamlit dashboard"""
     # Title and introduction
@@ -942,7 +996,9 @@ def main():
 
     # Add current date based on latest ingestion
     loader = get_data_loader()
-    latest_data_date = loader.get_latest_ingestion_date() if loader else None
+    if loader:
+        _prune_persisted_caches()
+    latest_data_date = _latest_ingestion_date() if loader else None
     if latest_data_date:
         formatted_date = latest_data_date.strftime("%B %d, %Y")
         st.markdown(f"Data as of: **{formatted_date}**")
@@ -966,47 +1022,31 @@ def main():
     # Get available study processes
     if loader:
         try:
-            study_processes = loader.get_study_processes()
+            study_process_labels = _study_process_labels(_data_version())
 
-            if not study_processes:
+            if not study_process_labels:
                 st.sidebar.warning("No study processes found in database")
-                st.session_state.study_process_filter = []
+                st.session_state.study_process_filter = frozenset()
             else:
-                # Create helpful labels for study processes
-                study_process_labels = {}
-                for sp in study_processes:
-                    if sp.startswith('C') and len(sp) > 1 and sp[1:].isdigit():
-                        study_process_labels[sp] = f"{sp} (Cluster {sp[1:]})"
-                    elif sp == 'Serial LGIP':
-                        study_process_labels[sp] = f"{sp} (Standard LGIP)"
-                    elif sp == 'TC':
-                        study_process_labels[sp] = f"{sp} (Transition Cluster)"
-                    elif sp == 'ISP':
-                        study_process_labels[sp] = f"{sp} (Independent Study Process)"
-                    elif sp == 'FT':
-                        study_process_labels[sp] = f"{sp} (Fast Track)"
-                    elif sp.startswith('SGIP'):
-                        study_process_labels[sp] = f"{sp} (Small Generator)"
-                    else:
-                        study_process_labels[sp] = sp
-
                 # Study process multiselect
                 selected_study_processes = st.sidebar.multiselect(
                     "Filter by Study Cluster:",
-                    options=study_processes,
+                    options=list(study_process_labels),
                     default=[],
-                    format_func=lambda x: study_process_labels.get(x, x),
+                    format_func=study_process_labels.get,
                     help="Filter all data by study process/cluster. Leave empty to show all projects."
                 )
 
-                # Store in session state for access across functions
-                if 'study_process_filter' not in st.session_state or st.session_state.study_process_filter != selected_study_processes:
-                    st.session_state.study_process_filter = selected_study_processes
+                # Store in session state for access across functions; a frozenset
+                # compares by value regardless of selection order
+                selected = frozenset(selected_study_processes)
+                if st.session_state.get('study_process_filter') != selected:
+                    st.session_state.study_process_filter = selected
         except Exception as e:
             st.sidebar.error(f"Error loading study processes: {str(e)}")
-            st.session_state.study_process_filter = []
+            st.session_state.study_process_filter = frozenset()
     else:
-        st.session_state.study_process_filter = []
+        st.session_state.study_process_filter = frozenset()
     
     # About section
     with st.sidebar.expander("About this Dashboard"):
@@ -1030,26 +1070,10 @@ def main():
             st.rerun()
 
     # Display the selected KPI visualization
-    if selected_kpi == "Overview":
-        create_overview()
-    elif selected_kpi == "Capacity by Fuel Type":
-        show_capacity_by_fuel()
-    elif selected_kpi == "Project Status":
-        show_project_status()
-    elif selected_kpi == "Top ISO Zones":
-        show_top_iso_zones()
-    elif selected_kpi == "Lead Time Analysis":
-        show_lead_time_analysis()
-    elif selected_kpi == "Timeline Delays":
-        show_timeline_delays()
-    elif selected_kpi == "Top Projects":
-        show_top_projects()
-    elif selected_kpi == "Project Map":
-        show_project_map()
-    elif selected_kpi == "Cluster 15":
-        create_cluster15_view()
-    elif selected_kpi == "Data Table":
-        show_data_table()
+    if loader:
+        # Warm the other views' reports while the selected one renders
+        _prefetch_reports(_data_version(), _study_key())
+        KPI_VIEWS[selected_kpi](loader, _study_key())
 
 if __name__ == "__main__":
     main()
@@ -2,9 +2,195 @@
 Data loading utilities for the CAISO Generator Interconnection Queue Dashboard
 """
 import sqlite3
+import queue
+import threading
 import pandas as pd
 import os
 import re
+import functools
+import inspect
+from collections import OrderedDict
+from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+
+# Friendly status names mapped to the project tables
+PROJECT_TABLES = {
+    'active': 'grid_generation_queue',
+    'completed': 'completed_projects',
+    'withdrawn': 'withdrawn_projects'
+}
+
+# Tables whose names may be interpolated into SQL
+KNOWN_TABLES = frozenset(PROJECT_TABLES.values()) | {'cluster_15_requests'}
+
+# Per-status totals materialized by the ETL (scripts/parse_queue.py)
+STATUS_SUMMARY_TABLE = 'agg_status'
+
+# Read tuning applied to every connection: 64 MB page cache, in-memory temp
+# storage for GROUP BY/ORDER BY, 256 MB memory-mapped reads, and no writes.
+# journal_mode is left alone; WAL would persist into the committed database file.
+CONNECTION_PRAGMAS = (
+    'cache_size=-65536',
+    'temp_store=MEMORY',
+    'mmap_size=268435456',
+    'query_only=1',
+)
+
+# Prepared statements kept per pooled connection. Filters change the number of
+# placeholders, so each filter combination is its own statement.
+STATEMENT_CACHE_SIZE = 512
+
+# Report results kept per loader. Filter values come from dashboard widgets, so
+# the least recently used combinations are evicted past this size.
+REPORT_CACHE_SIZE = 128
+
+# withdrawn_projects keeps the unmapped Excel header for the study process column
+WITHDRAWN_STUDY_PROCESS_COL = 'Unnamed: 6_level_0 Study\nProcess'
+
+
+# Columns returned by get_active_projects/get_all_projects when none are requested
+DEFAULT_PROJECT_COLUMNS = (
+    'project_name', 'queue_position', 'study_process', 'application_status',
+    'fuel_types', 'net_mw', 'county', 'state', 'queue_date',
+    'proposed_online_date', 'current_online_date'
+)
+
+# County name with any ' County' suffix removed, as the map's county labels expect
+COUNTY_NAME_SQL = "TRIM(REPLACE(REPLACE(REPLACE(county, ' County', ''), ' COUNTY', ''), ' county', ''))"
+
+# Rows fetched per batch by row-level project reads
+READ_CHUNK_ROWS = 50_000
+
+# Reports behind the dashboard views, warmed together by prefetch_dashboard
+DASHBOARD_REPORTS = (
+    'overview_metrics', 'capacity_by_fuel', 'project_count_by_status', 'top5_iso_zones',
+    'cancellation_rate', 'average_lead_time', 'timeline_delay_by_fuel', 'top_projects_by_net_mw'
+)
+
+# Low-cardinality string columns returned as pandas categoricals
+CATEGORY_COLUMNS = (
+    'fuel', 'fuel_types', 'status', 'county', 'state', 'study_process', 'iso_zone',
+    'pto_study_region'
+)
+
+
+def _with_categories(df):
+    """Cast low-cardinality string columns to categorical dtype"""
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df
+
+
+def _read_frame(query, conn, params=None):
+    """Read a query into a DataFrame straight from the cursor
+
+    Skips pd.read_sql's per-call SQLAlchemy detection and record coercion;
+    the small report results need neither.
+    """
+    cursor = conn.execute(query, params or [])
+    return pd.DataFrame(cursor.fetchall(), columns=[column[0] for column in cursor.description])
+
+
+def _read_arrow_chunks(query, conn, params=None, chunksize=READ_CHUNK_ROWS):
+    """Iterate over a row-level query as Arrow-backed DataFrames of chunksize rows"""
+    return pd.read_sql(query, conn, params=params, chunksize=chunksize, dtype_backend='pyarrow')
+
+
+def _read_arrow_frame(query, conn, params=None, chunksize=READ_CHUNK_ROWS):
+    """Read a row-level query in chunks into one Arrow-backed DataFrame"""
+    return pd.concat(
+        _read_arrow_chunks(query, conn, params=params, chunksize=chunksize), ignore_index=True
+    )
+
+
+def _quote_identifier(name):
+    """Quote a column or table name for use in SQL"""
+    return '"' + name.replace('"', '""') + '"'
+
+
+@functools.lru_cache(maxsize=32)
+def _study_process_filter(count, column='study_process', prefix='WHERE'):
+    """Build a study process IN (?, ...) condition for count values
+
+    Memoized per shape, since the dashboard repeats the same filter sizes.
+    The prefix ('WHERE', 'AND', or None) is prepended when given.
+    """
+    condition = f"{_quote_identifier(column)} IN ({','.join('?' * count)})"
+    return f"{prefix} {condition}" if prefix else condition
+
+
+def _fuel_contains_clause(fuel_tokens):
+    """Build a predicate matching fuel_types containing any of the tokens
+
+    Matching is a case-sensitive substring test, like str.contains.
+    """
+    return '(' + ' OR '.join('instr(fuel_types, ?) > 0' for _ in fuel_tokens) + ')'
+
+
+def _hashable(value):
+    """Convert call arguments into a report cache key
+
+    List arguments are filter values whose order does not matter, so they key
+    as frozensets; an empty list filters nothing, the same as None.
+    """
+    if isinstance(value, list):
+        return frozenset(value) or None
+    if isinstance(value, tuple):
+        return tuple(_hashable(item) for item in value)
+    return value
+
+
+def _memoized_report(method):
+    """Cache a method's result until the database file changes
+
+    Results are keyed on the call arguments and kept in a least recently used
+    cache of REPORT_CACHE_SIZE entries; a new database modification time clears
+    it. Entries are futures, so a call that arrives while the same report is
+    still running (e.g. from prefetch_dashboard) waits for it instead of
+    querying again. Callers receive a copy so the cached frame cannot be mutated.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        # Bind so positional, keyword and defaulted calls share one key
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        key = (method.__name__, _hashable(tuple(bound.arguments.values())[1:]))
+        version = self.data_version()
+        with self._report_lock:
+            if self._report_version != version:
+                self._report_cache.clear()
+                self._report_version = version
+            future = self._report_cache.get(key)
+            computing = future is None
+            if computing:
+                future = Future()
+                self._report_cache[key] = future
+                while len(self._report_cache) > REPORT_CACHE_SIZE:
+                    self._report_cache.popitem(last=False)
+            else:
+                self._report_cache.move_to_end(key)
+        if computing:
+            try:
+                future.set_result(method(self, *args, **kwargs))
+            except BaseException as e:
+                # Waiting callers see the error; later calls try again
+                future.set_exception(e)
+                with self._report_lock:
+                    if self._report_cache.get(key) is future:
+                        del self._report_cache[key]
+                raise
+        return future.result().copy()
+    return wrapper
+
+
+def _log_prefetch_error(name, future):
+    """Print the error from a prefetched report, which no caller may collect"""
+    if not future.cancelled() and future.exception() is not None:
+        print(f"Error prefetching {name}: {future.exception()}")
 
 
 def _study_process_sort_key(study_process):
@@ -17,11 +203,12 @@ def _study_process_sort_key(study_process):
 class DataLoader:
     """Handles data loading from the CAISO queue database"""
 
-    def __init__(self, db_path=None):
+    def __init__(self, db_path=None, pool_size=4):
         """Initialize with the path to the SQLite database
 
         Args:
             db_path (str): Path to database. If None, will try to find it automatically.
+            pool_size (int): Maximum number of idle connections kept open for reuse
         """
         if db_path is None:
             # Try to find the database in common locations
@@ -47,107 +234,186 @@ class DataLoader:
             raise FileNotFoundError(f"Database file not found at: {db_path}")
         else:
             print(f"DEBUG: Using database at: {os.path.abspath(db_path)}")
-            
+
+        # Idle connections, most recently used on top so its page cache stays warm
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+        # Report futures by (method, arguments) for the data version below
+        self._report_cache = OrderedDict()
+        self._report_version = None
+        self._report_lock = threading.Lock()
+        # Workers for prefetch_dashboard; threads start on first submit
+        self._executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix='report-prefetch')
+
+    def data_version(self):
+        """Return the database modification time, which changes on each data refresh"""
+        return os.path.getmtime(self.db_path)
+
     def get_conn(self):
-        """Get a database connection"""
-        return sqlite3.connect(self.db_path)
+        """Get a new database connection"""
+        # Pooled connections are handed to whichever Streamlit thread checks them out
+        conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE
+        )
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(f"PRAGMA {pragma}")
+        return conn
+
+    @contextmanager
+    def _checkout(self):
+        """Borrow a pooled connection, opening one if none is idle"""
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = self.get_conn()
+        try:
+            yield conn
+        finally:
+            try:
+                self._pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+
+    def close(self):
+        """Stop prefetch workers and close all idle pooled connections"""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def prefetch_dashboard(self, study_processes=None):
+        """Run the dashboard reports concurrently to warm the report cache
+
+        Each report checks out its own pooled connection, so the queries overlap
+        and the wall-clock cost is roughly that of the slowest one. Errors are
+        printed as each report finishes.
+
+        Args:
+            study_processes (list): Optional list of study processes to filter by
+
+        Returns:
+            dict: Report method name mapped to a Future of its result
+        """
+        futures = {}
+        for name in DASHBOARD_REPORTS:
+            futures[name] = self._executor.submit(getattr(self, name), study_processes=study_processes)
+            futures[name].add_done_callback(functools.partial(_log_prefetch_error, name))
+        return futures
+
+    def _has_status_summary(self, conn):
+        """Check whether the ETL's per-status summary table exists"""
+        return conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?",
+            (STATUS_SUMMARY_TABLE,)
+        ).fetchone() is not None
     
-    def capacity_by_fuel(self, study_processes=None):
+    @_memoized_report
+    def capacity_by_fuel(self, study_processes=None, fuel_contains=None):
         """Load capacity by fuel type data
 
         Args:
             study_processes (list): Optional list of study processes to filter by
+            fuel_contains (list): Optional fuel tokens; keep fuel types containing any of them
         """
-        conn = self.get_conn()
-
         # Build WHERE clause if filtering
-        where_clause = ""
+        conditions = []
         params = []
         if study_processes:
-            placeholders = ','.join(['?' for _ in study_processes])
-            where_clause = f"WHERE study_process IN ({placeholders})"
-            params = study_processes
-
-        df = pd.read_sql(
-            f"""
-            SELECT fuel_types AS fuel, SUM(net_mw) AS total_mw
-            FROM grid_generation_queue
-            {where_clause}
-            GROUP BY fuel_types
-            """, conn, params=params
-        )
-        conn.close()
-        return df
+            conditions.append(_study_process_filter(len(study_processes), prefix=None))
+            params.extend(study_processes)
+        if fuel_contains:
+            conditions.append(_fuel_contains_clause(fuel_contains))
+            params.extend(fuel_contains)
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        with self._checkout() as conn:
+            df = _read_frame(
+                f"""
+                SELECT fuel_types AS fuel, SUM(net_mw) AS total_mw
+                FROM grid_generation_queue
+                {where_clause}
+                GROUP BY fuel_types
+                ORDER BY total_mw DESC
+                """, conn, params=params
+            )
+        return _with_categories(df)
     
+    @_memoized_report
     def project_count_by_status(self, study_processes=None):
         """Load project count by status data
 
         Args:
             study_processes (list): Optional list of study processes to filter by
         """
-        conn = self.get_conn()
+        with self._checkout() as conn:
+            # Unfiltered totals come from the summary table when the ETL built one
+            if not study_processes and self._has_status_summary(conn):
+                df = _read_frame(
+                    f"SELECT status, project_count, total_mw FROM {STATUS_SUMMARY_TABLE}", conn
+                )
+                return _with_categories(df)
 
-        # Build WHERE clause if filtering
-        where_clause_active = ""
-        where_clause_withdrawn = ""
-        params = []
-        if study_processes:
-            placeholders = ','.join(['?' for _ in study_processes])
-            where_clause_active = f"WHERE study_process IN ({placeholders})"
-            # withdrawn_projects has different column name
-            where_clause_withdrawn = f'WHERE "Unnamed: 6_level_0 Study\nProcess" IN ({placeholders})'
-            # Need to pass parameters 3 times (once for each table)
-            params = study_processes * 3
+            # Build WHERE clause if filtering
+            where_clause_active = ""
+            where_clause_withdrawn = ""
+            params = []
+            if study_processes:
+                where_clause_active = _study_process_filter(len(study_processes))
+                # withdrawn_projects has different column name
+                where_clause_withdrawn = _study_process_filter(len(study_processes), WITHDRAWN_STUDY_PROCESS_COL)
+                # Need to pass parameters 3 times (once for each table)
+                params = study_processes * 3
 
-        df = pd.read_sql(
-            f"""
-            SELECT
-                'Active' as status,
-                COUNT(*) AS project_count,
-                COALESCE(SUM(net_mw), 0) AS total_mw
-            FROM grid_generation_queue
-            {where_clause_active}
+            df = _read_frame(
+                f"""
+                SELECT
+                    'Active' as status,
+                    COUNT(*) AS project_count,
+                    COALESCE(SUM(net_mw), 0) AS total_mw
+                FROM grid_generation_queue
+                {where_clause_active}
 
-            UNION ALL
+                UNION ALL
 
-            SELECT
-                'Completed' as status,
-                COUNT(*) AS project_count,
-                COALESCE(SUM(net_mw), 0) AS total_mw
-            FROM completed_projects
-            {where_clause_active}
+                SELECT
+                    'Completed' as status,
+                    COUNT(*) AS project_count,
+                    COALESCE(SUM(net_mw), 0) AS total_mw
+                FROM completed_projects
+                {where_clause_active}
 
-            UNION ALL
+                UNION ALL
 
-            SELECT
-                'Withdrawn' as status,
-                COUNT(*) AS project_count,
-                COALESCE(SUM(net_mw), 0) AS total_mw
-            FROM withdrawn_projects
-            {where_clause_withdrawn}
-            """, conn, params=params
-        )
-        conn.close()
-        return df
+                SELECT
+                    'Withdrawn' as status,
+                    COUNT(*) AS project_count,
+                    COALESCE(SUM(net_mw), 0) AS total_mw
+                FROM withdrawn_projects
+                {where_clause_withdrawn}
+                """, conn, params=params
+            )
+        return _with_categories(df)
     
-    def top5_iso_zones(self, study_processes=None):
-        """Load top 5 ISO zones data
-
-        Args:
-            study_processes (list): Optional list of study processes to filter by
-        """
-        try:
-            # Build WHERE clause if filtering
-            where_clause = ""
-            params = []
-            if study_processes:
-                placeholders = ','.join(['?' for _ in study_processes])
-                where_clause = f"WHERE study_process IN ({placeholders})"
-                params = study_processes
+    @_memoized_report
+    def _top5_iso_zones_for(self, study_processes):
+        """Query the top 5 ISO zones; errors propagate so they are not cached"""
+        # Build WHERE clause if filtering
+        where_clause = ""
+        params = []
+        if study_processes:
+            where_clause = _study_process_filter(len(study_processes))
+            params = study_processes
 
-            # Query from database
-            conn = self.get_conn()
-            df = pd.read_sql(
+        # Query from database
+        with self._checkout() as conn:
+            df = _read_frame(
                 f"""
                 SELECT pto_study_region AS iso_zone, SUM(net_mw) AS total_mw
                 FROM grid_generation_queue
@@ -157,424 +423,654 @@ class DataLoader:
                 LIMIT 5
                 """, conn, params=params
             )
-            conn.close()
 
-            # Validate the dataframe before returning
-            if df is not None and not df.empty and 'iso_zone' in df.columns and 'total_mw' in df.columns:
-                return df
-            else:
-                # Return an empty dataframe with the expected schema
-                return pd.DataFrame(columns=['iso_zone', 'total_mw'])
+        # Validate the dataframe before returning
+        if df is not None and not df.empty and 'iso_zone' in df.columns and 'total_mw' in df.columns:
+            return _with_categories(df)
+        else:
+            # Return an empty dataframe with the expected schema
+            return pd.DataFrame(columns=['iso_zone', 'total_mw'])
+
+    def top5_iso_zones(self, study_processes=None):
+        """Load top 5 ISO zones data
 
+        Args:
+            study_processes (list): Optional list of study processes to filter by
+        """
+        try:
+            return self._top5_iso_zones_for(study_processes)
         except Exception as e:
             print(f"Error in top5_iso_zones: {str(e)}")
             # Return an empty dataframe with the expected schema
             return pd.DataFrame(columns=['iso_zone', 'total_mw'])
     
+    @_memoized_report
     def cancellation_rate(self, study_processes=None):
         """Load cancellation rate data
 
         Args:
             study_processes (list): Optional list of study processes to filter by
         """
-        conn = self.get_conn()
-
         # Build WHERE clause if filtering
         where_clause_active = ""
         where_clause_withdrawn = ""
         params = []
         if study_processes:
-            placeholders = ','.join(['?' for _ in study_processes])
-            where_clause_active = f"WHERE study_process IN ({placeholders})"
+            where_clause_active = _study_process_filter(len(study_processes))
             # withdrawn_projects has different column name
-            where_clause_withdrawn = f'WHERE "Unnamed: 6_level_0 Study\nProcess" IN ({placeholders})'
-            params = study_processes
+            where_clause_withdrawn = _study_process_filter(len(study_processes), WITHDRAWN_STUDY_PROCESS_COL)
+            # Active, completed and withdrawn subqueries each filter
+            params = list(study_processes) * 3
+
+        with self._checkout() as conn:
+            # Active, completed and withdrawn MW in one round trip
+            active, completed, withdrawn = conn.execute(
+                f"""
+                SELECT
+                    (SELECT COALESCE(SUM(net_mw), 0) FROM grid_generation_queue {where_clause_active}),
+                    (SELECT COALESCE(SUM(net_mw), 0) FROM completed_projects {where_clause_active}),
+                    (SELECT COALESCE(SUM(net_mw), 0) FROM withdrawn_projects {where_clause_withdrawn})
+                """, params
+            ).fetchone()
 
-        # Get active MW from active projects
-        active = pd.read_sql(
-            f"SELECT SUM(net_mw) AS total_mw FROM grid_generation_queue {where_clause_active}",
-            conn, params=params
-        ).iloc[0,0] or 0
-
-        # Get completed MW from completed projects
-        completed = pd.read_sql(
-            f"SELECT SUM(net_mw) AS total_mw FROM completed_projects {where_clause_active}",
-            conn, params=params
-        ).iloc[0,0] or 0
-
-        # Get total MW from withdrawn projects
-        withdrawn = pd.read_sql(
-            f"SELECT SUM(net_mw) AS withdrawn_mw FROM withdrawn_projects {where_clause_withdrawn}",
-            conn, params=params
-        ).iloc[0,0] or 0
-
-        conn.close()
         total = active + completed + withdrawn
         rate = withdrawn / total if total else 0
         return pd.DataFrame([{'cancellation_rate': rate}])
     
+    @_memoized_report
     def average_lead_time(self, study_processes=None):
         """Load average lead time data
 
         Args:
             study_processes (list): Optional list of study processes to filter by
         """
-        conn = self.get_conn()
-
         # Build WHERE clause if filtering
         where_clause = "WHERE queue_date IS NOT NULL AND request_receive_date IS NOT NULL"
         params = []
         if study_processes:
-            placeholders = ','.join(['?' for _ in study_processes])
-            where_clause += f" AND study_process IN ({placeholders})"
+            where_clause += " " + _study_process_filter(len(study_processes), prefix='AND')
             params = study_processes
 
-        df = pd.read_sql(
-            f"SELECT queue_date AS Queue_Date, "
-            "request_receive_date AS Request_Received_Date "
-            f"FROM grid_generation_queue {where_clause}", conn,
-            parse_dates=['Queue_Date','Request_Received_Date'],
-            params=params
-        )
-        conn.close()
-        if df.empty:
-            return pd.DataFrame([{'average_lead_time_days': 0}])
-        df['lead_time'] = (df['Queue_Date'] - df['Request_Received_Date']).dt.days
-        avg = df['lead_time'].mean()
-        if pd.isna(avg):
-            avg = 0
+        # Days are floored like pandas Timedelta.days before averaging
+        with self._checkout() as conn:
+            avg = conn.execute(
+                f"""
+                SELECT COALESCE(AVG(CAST(days AS INTEGER) - (days < CAST(days AS INTEGER))), 0)
+                FROM (
+                    SELECT julianday(queue_date) - julianday(request_receive_date) AS days
+                    FROM grid_generation_queue {where_clause}
+                )
+                """, params
+            ).fetchone()[0]
         return pd.DataFrame([{'average_lead_time_days': avg}])
     
-    def top_projects_by_net_mw(self, study_processes=None):
-        """Load top projects by net MW data
+    @_memoized_report
+    def overview_metrics(self, study_processes=None):
+        """Load the overview status totals, cancellation rate and lead time in one query
 
         Args:
             study_processes (list): Optional list of study processes to filter by
+
+        Returns:
+            pd.DataFrame: One row per status with project_count and total_mw, plus
+                the cancellation_rate and average_lead_time_days repeated on each row
         """
-        conn = self.get_conn()
+        # Build WHERE clauses if filtering
+        where_clause_active = ""
+        where_clause_withdrawn = ""
+        where_clause_lead_time = "WHERE queue_date IS NOT NULL AND request_receive_date IS NOT NULL"
+        params = []
+        if study_processes:
+            where_clause_active = _study_process_filter(len(study_processes))
+            where_clause_withdrawn = _study_process_filter(len(study_processes), WITHDRAWN_STUDY_PROCESS_COL)
+            where_clause_lead_time += " " + _study_process_filter(len(study_processes), prefix='AND')
+            # Active, completed, withdrawn and lead time subqueries each filter
+            params = list(study_processes) * 4
+
+        with self._checkout() as conn:
+            if not study_processes and self._has_status_summary(conn):
+                # Unfiltered totals come from the summary table when the ETL built one
+                status_totals = f"SELECT status, project_count, total_mw FROM {STATUS_SUMMARY_TABLE}"
+            else:
+                status_totals = f"""
+                    SELECT 'Active' AS status, COUNT(*) AS project_count,
+                           COALESCE(SUM(net_mw), 0) AS total_mw
+                    FROM grid_generation_queue {where_clause_active}
+                    UNION ALL
+                    SELECT 'Completed', COUNT(*), COALESCE(SUM(net_mw), 0)
+                    FROM completed_projects {where_clause_active}
+                    UNION ALL
+                    SELECT 'Withdrawn', COUNT(*), COALESCE(SUM(net_mw), 0)
+                    FROM withdrawn_projects {where_clause_withdrawn}
+                """
 
-        # Build WHERE clause if filtering
+            # Lead time days are floored like pandas Timedelta.days
+            df = _read_frame(
+                f"""
+                WITH status_totals AS ({status_totals}),
+                lead_times AS (
+                    SELECT julianday(queue_date) - julianday(request_receive_date) AS days
+                    FROM grid_generation_queue {where_clause_lead_time}
+                )
+                SELECT
+                    status,
+                    project_count,
+                    total_mw,
+                    (
+                        SELECT CASE WHEN SUM(total_mw) > 0
+                            THEN 1.0 * SUM(CASE WHEN status = 'Withdrawn' THEN total_mw ELSE 0 END) / SUM(total_mw)
+                            ELSE 0 END
+                        FROM status_totals
+                    ) AS cancellation_rate,
+                    (
+                        SELECT COALESCE(AVG(CAST(days AS INTEGER) - (days < CAST(days AS INTEGER))), 0)
+                        FROM lead_times
+                    ) AS average_lead_time_days
+                FROM status_totals
+                """, conn, params=params
+            )
+        return _with_categories(df)
+
+    @_memoized_report
+    def top_projects_by_net_mw(self, study_processes=None, fuel_contains=None, limit=10):
+        """Load top projects by net MW data
+
+        Args:
+            study_processes (list): Optional list of study processes to filter by
+            fuel_contains (list): Optional fuel tokens; keep projects whose fuel types contain any of them
+            limit (int): Number of projects to return
+        """
+        # The ETL keeps one row per queue position, so rows are already per project
+        # and the net_mw index can serve the ORDER BY ... LIMIT directly
         where_clause = "WHERE net_mw IS NOT NULL"
         params = []
         if study_processes:
-            placeholders = ','.join(['?' for _ in study_processes])
-            where_clause += f" AND study_process IN ({placeholders})"
-            params = study_processes
-
-        df = pd.read_sql(
-            f"""
-            SELECT
-                project_name,
-                queue_position,
-                net_mw,
-                fuel_types,
-                study_process,
-                'Active' AS status,
-                county,
-                state
-            FROM grid_generation_queue
-            {where_clause}
-            GROUP BY project_name, queue_position
-            ORDER BY MAX(net_mw) DESC
-            LIMIT 10
-            """, conn, params=params
-        )
-        conn.close()
-        return df
+            where_clause += " " + _study_process_filter(len(study_processes), prefix='AND')
+            params.extend(study_processes)
+        if fuel_contains:
+            where_clause += f" AND {_fuel_contains_clause(fuel_contains)}"
+            params.extend(fuel_contains)
+
+        with self._checkout() as conn:
+            df = _read_frame(
+                f"""
+                SELECT
+                    project_name,
+                    queue_position,
+                    net_mw,
+                    fuel_types,
+                    study_process,
+                    'Active' AS status,
+                    county,
+                    state
+                FROM grid_generation_queue
+                {where_clause}
+                ORDER BY net_mw DESC, project_name, queue_position
+                LIMIT ?
+                """, conn, params=params + [limit]
+            )
+        return _with_categories(df)
     
-    def timeline_delay_by_fuel(self, study_processes=None):
+    @_memoized_report
+    def timeline_delay_by_fuel(self, study_processes=None, fuel_contains=None):
         """Load timeline delay by fuel data
 
+        Delay is the slip from the originally proposed online date to the
+        current online date, for projects whose date has moved later.
+
         Args:
             study_processes (list): Optional list of study processes to filter by
+            fuel_contains (list): Optional fuel tokens; keep fuel types containing any of them
         """
-        conn = self.get_conn()
-
         # Build WHERE clause if filtering
-        where_clause = "WHERE actual_online_date IS NOT NULL AND planned_online_date IS NOT NULL AND actual_online_date > planned_online_date"
+        where_clause = "WHERE current_online_date IS NOT NULL AND proposed_online_date IS NOT NULL AND current_online_date > proposed_online_date"
         params = []
         if study_processes:
-            placeholders = ','.join(['?' for _ in study_processes])
-            where_clause += f" AND study_process IN ({placeholders})"
-            params = study_processes
-
-        df = pd.read_sql(
-            f"""
-            SELECT
-                fuel_types AS fuel,
-                AVG(timeline_delay) AS avg_delay_days
-            FROM (
+            where_clause += " " + _study_process_filter(len(study_processes), prefix='AND')
+            params.extend(study_processes)
+        if fuel_contains:
+            where_clause += f" AND {_fuel_contains_clause(fuel_contains)}"
+            params.extend(fuel_contains)
+
+        with self._checkout() as conn:
+            df = _read_frame(
+                f"""
                 SELECT
-                    fuel_types,
-                    (
-                        julianday(actual_online_date) -
-                        julianday(planned_online_date)
-                    ) AS timeline_delay
-                FROM grid_generation_queue
-                {where_clause}
+                    fuel_types AS fuel,
+                    AVG(timeline_delay) AS avg_delay_days
+                FROM (
+                    SELECT
+                        fuel_types,
+                        (
+                            julianday(current_online_date) -
+                            julianday(proposed_online_date)
+                        ) AS timeline_delay
+                    FROM grid_generation_queue
+                    {where_clause}
+                )
+                GROUP BY fuel_types
+                ORDER BY avg_delay_days DESC
+                """, conn, params=params
             )
-            GROUP BY fuel_types
-            ORDER BY avg_delay_days DESC
-            """, conn, params=params
-        )
-        conn.close()
-        return df
+        return _with_categories(df)
     
-    def get_active_projects(self):
-        """Get all active projects data for filtering"""
-        conn = self.get_conn()
-        df = pd.read_sql(
-            """
-            SELECT * FROM grid_generation_queue
-            """, conn
-        )
-        conn.close()
-        return df
+    def get_active_projects(self, columns=None, study_processes=None):
+        """Get active projects data for filtering
 
-    def get_project_locations(self, status='all'):
+        Args:
+            columns (list): Column names to select, or None for DEFAULT_PROJECT_COLUMNS.
+                Names not in grid_generation_queue are ignored.
+            study_processes (list): Optional list of study processes to filter by
+        """
+        col_select = '*'
+        available = self.get_table_columns('grid_generation_queue')
+        selected = [col for col in (columns or DEFAULT_PROJECT_COLUMNS) if col in available]
+        if selected:
+            col_select = ', '.join(_quote_identifier(col) for col in selected)
+
+        where_clause = ""
+        params = []
+        if study_processes:
+            where_clause = _study_process_filter(len(study_processes))
+            params = list(study_processes)
+
+        with self._checkout() as conn:
+            df = _read_arrow_frame(
+                f"SELECT {col_select} FROM grid_generation_queue {where_clause}", conn, params=params
+            )
+        return _with_categories(df)
+
+    @staticmethod
+    def _locations_select(status):
+        """SELECT of located projects for one status, with county suffixes stripped in SQL"""
+        return f"""
+            SELECT
+                project_name,
+                {COUNTY_NAME_SQL} as county,
+                state,
+                net_mw as capacity,
+                CAST(latitude AS FLOAT) as latitude,
+                CAST(longitude AS FLOAT) as longitude,
+                '{status.capitalize()}' as status
+            FROM {PROJECT_TABLES[status]}
+            WHERE county IS NOT NULL AND state IS NOT NULL
+                AND latitude IS NOT NULL AND longitude IS NOT NULL
+        """
+
+    @_memoized_report
+    def _locations_for(self, status):
+        """Load located projects for one status
+
+        Each status is cached separately, so 'all' reuses single-status results.
+        """
+        with self._checkout() as conn:
+            return _read_frame(self._locations_select(status), conn)
+
+    @_memoized_report
+    def _county_locations_for(self, statuses):
+        """Aggregate located projects for the given statuses per county point in SQL"""
+        query = f"""
+            SELECT
+                county,
+                state,
+                latitude,
+                longitude,
+                COUNT(*) as project_count,
+                TOTAL(capacity) as total_capacity
+            FROM ({' UNION ALL '.join(self._locations_select(status) for status in statuses)})
+            GROUP BY county, state, latitude, longitude
+        """
+        with self._checkout() as conn:
+            return _read_frame(query, conn)
+
+    def get_project_locations(self, status='all', county_only=False):
         """Load project location data with optional status filter
         
         Args:
             status (str): Filter by status ('active', 'completed', 'withdrawn', or 'all')
+            county_only (bool): Return one row per county point with project_count and
+                total_capacity instead of one row per project
         """
         try:
-            conn = self.get_conn()
-            
-            # Base query for active projects
-            active_query = """
-                SELECT 
-                    project_name,
-                    county,
-                    state,
-                    net_mw as capacity,
-                    CAST(latitude AS FLOAT) as latitude,
-                    CAST(longitude AS FLOAT) as longitude,
-                    'Active' as status
-                FROM grid_generation_queue
-                WHERE county IS NOT NULL AND state IS NOT NULL
-            """
-            
-            # Base query for completed projects
-            completed_query = """
-                SELECT 
-                    project_name,
-                    county,
-                    state,
-                    net_mw as capacity,
-                    CAST(latitude AS FLOAT) as latitude,
-                    CAST(longitude AS FLOAT) as longitude,
-                    'Completed' as status
-                FROM completed_projects
-                WHERE county IS NOT NULL AND state IS NOT NULL
-            """
-            
-            # Base query for withdrawn projects
-            withdrawn_query = """
-                SELECT 
-                    project_name,
-                    county,
-                    state,
-                    net_mw as capacity,
-                    CAST(latitude AS FLOAT) as latitude,
-                    CAST(longitude AS FLOAT) as longitude,
-                    'Withdrawn' as status
-                FROM withdrawn_projects
-                WHERE county IS NOT NULL AND state IS NOT NULL
-            """
-            
-            # Combine queries based on status filter
-            if status == 'active':
-                query = active_query
-            elif status == 'completed':
-                query = completed_query
-            elif status == 'withdrawn':
-                query = withdrawn_query
-            else:  # 'all'
-                query = f"{active_query} UNION ALL {completed_query} UNION ALL {withdrawn_query}"
-            
-            df = pd.read_sql(query, conn)
-            conn.close()
-            
-            # Clean up county names (remove 'County' suffix and standardize)
-            df['county'] = df['county'].str.replace(' County', '', case=False)
-            df['county'] = df['county'].str.strip()
-            
-            # Ensure latitude and longitude are numeric
-            df['latitude'] = pd.to_numeric(df['latitude'], errors='coerce')
-            df['longitude'] = pd.to_numeric(df['longitude'], errors='coerce')
-            
-            # Drop rows with invalid coordinates
-            df = df.dropna(subset=['latitude', 'longitude'])
-            
-            return df
+            statuses = [status] if status in PROJECT_TABLES else list(PROJECT_TABLES)
+            if county_only:
+                df = self._county_locations_for(tuple(statuses))
+            else:
+                df = pd.concat([self._locations_for(key) for key in statuses], ignore_index=True)
+            # float32 keeps ~1 m precision, ample for plotting, at half the memory;
+            # capacity stays float64 so county totals sum exactly
+            df = df.astype({'latitude': 'float32', 'longitude': 'float32'})
+            return _with_categories(df)
             
         except Exception as e:
             print(f"Error in get_project_locations: {str(e)}")
+            if county_only:
+                return pd.DataFrame(columns=['county', 'state', 'latitude', 'longitude', 'project_count', 'total_capacity'])
             return pd.DataFrame(columns=['project_name', 'county', 'state', 'capacity', 'latitude', 'longitude', 'status'])
 
-    def get_all_projects(self, table='all', columns=None, study_processes=None):
+    def get_all_projects(self, table='all', columns=None, study_processes=None, chunksize=None):
         """Get all projects data with optional table and column filtering
 
         Args:
             table (str): Which table to query ('active', 'completed', 'withdrawn', or 'all')
-            columns (list): List of column names to select, or None for all columns
+            columns (list): List of column names to select, or None for DEFAULT_PROJECT_COLUMNS
             study_processes (list): Optional list of study processes to filter by
+            chunksize (int): Rows fetched per batch, or None for READ_CHUNK_ROWS;
+                smaller batches lower peak memory while the frame is assembled
 
         Returns:
             pd.DataFrame: DataFrame with project data
         """
-        conn = None
         try:
-            conn = self.get_conn()
-
-            # Map friendly names to actual table names
-            table_map = {
-                'active': 'grid_generation_queue',
-                'completed': 'completed_projects',
-                'withdrawn': 'withdrawn_projects'
-            }
+            # Unknown table names raise here rather than reaching the SQL
+            statuses = self._project_statuses(table)
+            output_columns = list(columns or DEFAULT_PROJECT_COLUMNS) + ['status']
 
             # Build WHERE clause if filtering by study process
             where_clause_active = ""
             where_clause_withdrawn = ""
-            params = []
             if study_processes:
-                placeholders = ','.join(['?' for _ in study_processes])
-                where_clause_active = f"WHERE study_process IN ({placeholders})"
+                where_clause_active = _study_process_filter(len(study_processes))
                 # withdrawn_projects has different column name
-                where_clause_withdrawn = f'WHERE "Unnamed: 6_level_0 Study\nProcess" IN ({placeholders})'
-
-            # Build query based on table selection
-            if table == 'all':
-                # Get all projects from all tables with a status column
-                queries = []
-                for status, table_name in table_map.items():
-                    # Choose the correct WHERE clause based on table
-                    where_clause = where_clause_withdrawn if status == 'withdrawn' else where_clause_active
-
-                    if columns:
-                        # Add status column to selected columns
-                        cols_with_status = columns + [f"'{status.capitalize()}' as status"]
-                        col_select = ', '.join(cols_with_status)
-                    else:
-                        # For withdrawn_projects, we need to alias the study_process column
-                        if status == 'withdrawn':
-                            col_select = 'project_name, queue_position, request_receive_date, queue_date, application_status, ' \
-                                       '"Unnamed: 6_level_0 Study\nProcess" as study_process, ' \
-                                       'facility_type_1, facility_type_2, facility_type_3, fuel_type_1, fuel_type_2, fuel_type_3, ' \
-                                       'mw_1, mw_2, mw_3, net_mw, capacity_status, off_peak_deliverability, county, state, utility, ' \
-                                       'interconnection_point, proposed_online_date, current_online_date, feasibility_study, ' \
-                                       'system_impact_study_or_ph1, facility_study_or_ph2, optional_study, interconnection_study, ' \
-                                       f'ingestion_date, fuel_types, latitude, longitude, \'{status.capitalize()}\' as status'
-                        else:
-                            col_select = f"*, '{status.capitalize()}' as status"
-                    queries.append(f"SELECT {col_select} FROM {table_name} {where_clause}")
-
-                query = ' UNION ALL '.join(queries)
-                # Parameters need to be repeated for each UNION
-                if study_processes:
-                    params = study_processes * len(table_map)
-            else:
-                # Single table query
-                table_name = table_map.get(table, 'grid_generation_queue')
-                status = table.capitalize()
-
-                # Choose the correct WHERE clause based on table
-                where_clause = where_clause_withdrawn if table == 'withdrawn' else where_clause_active
-
-                if columns:
-                    cols_with_status = columns + [f"'{status}' as status"]
-                    col_select = ', '.join(cols_with_status)
-                else:
-                    # For withdrawn_projects, we need to alias the study_process column
-                    if table == 'withdrawn':
-                        col_select = 'project_name, queue_position, request_receive_date, queue_date, application_status, ' \
-                                   '"Unnamed: 6_level_0 Study\nProcess" as study_process, ' \
-                                   'facility_type_1, facility_type_2, facility_type_3, fuel_type_1, fuel_type_2, fuel_type_3, ' \
-                                   'mw_1, mw_2, mw_3, net_mw, capacity_status, off_peak_deliverability, county, state, utility, ' \
-                                   'interconnection_point, proposed_online_date, current_online_date, feasibility_study, ' \
-                                   'system_impact_study_or_ph1, facility_study_or_ph2, optional_study, interconnection_study, ' \
-                                   f'ingestion_date, fuel_types, latitude, longitude, \'{status}\' as status'
-                    else:
-                        col_select = f"*, '{status}' as status"
-                query = f"SELECT {col_select} FROM {table_name} {where_clause}"
+                where_clause_withdrawn = _study_process_filter(len(study_processes), WITHDRAWN_STUDY_PROCESS_COL)
+
+            # One SELECT per table, each projecting validated columns plus the status literal
+            queries = []
+            params = []
+            for status in statuses:
+                where_clause = where_clause_withdrawn if status == 'withdrawn' else where_clause_active
+                col_select = self._project_select_list(status, output_columns)
+                queries.append(f"SELECT {col_select} FROM {PROJECT_TABLES[status]} {where_clause}")
                 if study_processes:
-                    params = study_processes
+                    params.extend(study_processes)
+            query = ' UNION ALL '.join(queries)
 
-            df = pd.read_sql(query, conn, params=params)
-            return df
+            # Categories are applied once to the whole frame so every batch shares them
+            with self._checkout() as conn:
+                df = _read_arrow_frame(
+                    query, conn, params=params, chunksize=chunksize or READ_CHUNK_ROWS
+                )
+            return _with_categories(df)
 
         except Exception as e:
             print(f"Error in get_all_projects: {str(e)}")
             import traceback
             print(traceback.format_exc())
             return pd.DataFrame()
-        finally:
-            if conn is not None:
-                conn.close()
+
+    def _project_source_columns(self, status):
+        """Map output column names to source column names for a project table
+
+        The withdrawn table's study process column is exposed as study_process.
+        """
+        source_columns = {}
+        for column in self.get_table_columns(PROJECT_TABLES[status]):
+            if column == WITHDRAWN_STUDY_PROCESS_COL:
+                source_columns['study_process'] = column
+            else:
+                source_columns[column] = column
+        return source_columns
+
+    def _project_select_list(self, status, columns):
+        """Build the SELECT list for the given columns of one project table
+
+        Columns missing from the table are selected as NULL so every table
+        yields the same shape. The virtual 'status' column is a literal.
+        """
+        source_columns = self._project_source_columns(status)
+        exprs = []
+        for column in columns:
+            if column == 'status':
+                exprs.append(f"'{status.capitalize()}' AS status")
+            elif column in source_columns:
+                exprs.append(
+                    f"{_quote_identifier(source_columns[column])} AS {_quote_identifier(column)}"
+                )
+            else:
+                exprs.append(f"NULL AS {_quote_identifier(column)}")
+        return ', '.join(exprs)
+
+    def _projects_union(self, statuses, columns):
+        """Build a UNION ALL over the project tables selecting the given columns"""
+        branches = [
+            f"SELECT {self._project_select_list(status, columns)} FROM {PROJECT_TABLES[status]}"
+            for status in statuses
+        ]
+        return ' UNION ALL '.join(branches)
+
+    def _project_statuses(self, status):
+        """Resolve a status filter ('active', 'completed', 'withdrawn', 'all') to table keys"""
+        if status == 'all':
+            return list(PROJECT_TABLES)
+        if status not in PROJECT_TABLES:
+            raise ValueError(f"Unknown project status: {status}")
+        return [status]
+
+    def get_project_columns(self, status='all'):
+        """Get the columns available for projects with the given status
+
+        Args:
+            status (str): 'active', 'completed', 'withdrawn', or 'all'
+
+        Returns:
+            list: Column names across the selected tables, plus 'status'
+        """
+        columns = []
+        for key in self._project_statuses(status):
+            for column in self._project_source_columns(key):
+                if column not in columns:
+                    columns.append(column)
+        columns.append('status')
+        return columns
+
+    def query_projects(self, status='all', study_processes=None, counties=None, states=None,
+                       fuel_tokens=None, min_capacity=None, name_search=None, columns=None,
+                       limit=None, offset=None):
+        """Query project rows with all filters applied in SQL
+
+        Args:
+            status (str): 'active', 'completed', 'withdrawn', or 'all'
+            study_processes (list): Optional study processes to filter by
+            counties (list): Optional counties to filter by
+            states (list): Optional states to filter by
+            fuel_tokens (list): Keep projects whose fuel_types contains any of these
+            min_capacity (float): Minimum net MW (missing capacity counts as 0)
+            name_search (str): Case-insensitive substring of the project name
+            columns (list): Columns to return, or None for all columns
+            limit (int): Maximum number of rows to return
+            offset (int): Number of rows to skip
+
+        Returns:
+            pd.DataFrame: Matching projects with the requested columns, Arrow-backed
+                so the table view hands them to Streamlit without conversion
+        """
+        try:
+            statuses = self._project_statuses(status)
+            available = self.get_project_columns(status)
+            if columns:
+                output_columns = [col for col in columns if col in available]
+            else:
+                output_columns = available
+
+            conditions = []
+            params = []
+            filter_columns = []
+            if study_processes:
+                conditions.append(_study_process_filter(len(study_processes), prefix=None))
+                params.extend(study_processes)
+                filter_columns.append('study_process')
+            if counties:
+                conditions.append(f"county IN ({','.join('?' * len(counties))})")
+                params.extend(counties)
+                filter_columns.append('county')
+            if states:
+                conditions.append(f"state IN ({','.join('?' * len(states))})")
+                params.extend(states)
+                filter_columns.append('state')
+            if fuel_tokens:
+                conditions.append(
+                    _fuel_contains_clause(fuel_tokens)
+                )
+                params.extend(fuel_tokens)
+                filter_columns.append('fuel_types')
+            if min_capacity:
+                conditions.append("COALESCE(net_mw, 0) >= ?")
+                params.append(min_capacity)
+                filter_columns.append('net_mw')
+            if name_search:
+                escaped = name_search.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+                conditions.append("project_name LIKE ? ESCAPE '\\'")
+                params.append(f"%{escaped}%")
+                filter_columns.append('project_name')
+
+            inner_columns = output_columns + [
+                col for col in filter_columns if col not in output_columns
+            ]
+            where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            query = (
+                f"SELECT {', '.join(_quote_identifier(col) for col in output_columns)} "
+                f"FROM ({self._projects_union(statuses, inner_columns)}) {where_clause}"
+            )
+            if limit is not None or offset:
+                query += " LIMIT ? OFFSET ?"
+                params.extend([-1 if limit is None else limit, offset or 0])
+
+            with self._checkout() as conn:
+                return _with_categories(_read_arrow_frame(query, conn, params=params))
+        except Exception as e:
+            print(f"Error in query_projects: {str(e)}")
+            return pd.DataFrame()
+
+    def get_distinct_values(self, column, status='all', study_processes=None):
+        """Get the sorted distinct non-null values of a project column
+
+        Args:
+            column (str): Column name (as returned by get_project_columns)
+            status (str): 'active', 'completed', 'withdrawn', or 'all'
+            study_processes (list): Optional study processes to filter by
+
+        Returns:
+            list: Sorted distinct values
+        """
+        try:
+            statuses = self._project_statuses(status)
+            if column not in self.get_project_columns(status):
+                return []
+            inner_columns = [column] if column == 'study_process' else [column, 'study_process']
+            where_clause = f"WHERE {_quote_identifier(column)} IS NOT NULL"
+            params = []
+            if study_processes:
+                where_clause += " " + _study_process_filter(len(study_processes), prefix='AND')
+                params = list(study_processes)
+            query = (
+                f"SELECT DISTINCT {_quote_identifier(column)} "
+                f"FROM ({self._projects_union(statuses, inner_columns)}) {where_clause} "
+                f"ORDER BY 1"
+            )
+            with self._checkout() as conn:
+                return [row[0] for row in conn.execute(query, params).fetchall()]
+        except Exception as e:
+            print(f"Error in get_distinct_values: {str(e)}")
+            return []
+
+    @_memoized_report
+    def _table_columns_for(self, table):
+        """Query a known table's column names; errors propagate so they are not cached"""
+        # PRAGMA arguments cannot be bound, hence the KNOWN_TABLES check in get_table_columns
+        with self._checkout() as conn:
+            rows = conn.execute(f"PRAGMA table_info({_quote_identifier(table)})").fetchall()
+        # table_info is empty for a missing table; raise so the table is looked up again
+        if not rows:
+            raise sqlite3.OperationalError(f"no such table: {table}")
+        return [row[1] for row in rows]
 
     def get_table_columns(self, table='grid_generation_queue'):
         """Get column names from a specific table
 
         Args:
-            table (str): Table name
+            table (str): Table name; one of KNOWN_TABLES
 
         Returns:
             list: List of column names
         """
-        conn = None
         try:
-            conn = self.get_conn()
-            cursor = conn.execute(f"SELECT * FROM {table} LIMIT 0")
-            columns = [description[0] for description in cursor.description]
-            return columns
+            if table not in KNOWN_TABLES:
+                raise ValueError(f"Unknown table: {table}")
+            return self._table_columns_for(table)
         except Exception as e:
             print(f"Error getting columns from {table}: {str(e)}")
             return []
-        finally:
-            if conn is not None:
-                conn.close()
 
     def get_latest_ingestion_date(self):
         """Return the most recent ingestion date across known tables."""
-        conn = None
         try:
-            conn = self.get_conn()
             tables = [
                 'grid_generation_queue',
                 'completed_projects',
                 'withdrawn_projects',
                 'cluster_15_requests'
             ]
-            latest_dates = []
-            for table in tables:
-                exists = conn.execute(
-                    "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
-                    (table,)
-                ).fetchone()
-                if not exists:
-                    continue
-                df = pd.read_sql(
-                    f"SELECT MAX(ingestion_date) AS latest_date FROM {table}",
-                    conn,
-                    parse_dates=['latest_date']
-                )
-                if df.empty:
-                    continue
-                latest_value = df['latest_date'].iloc[0]
-                if pd.isna(latest_value):
-                    continue
-                latest_dates.append(latest_value)
-            if not latest_dates:
+            placeholders = ','.join('?' for _ in tables)
+            with self._checkout() as conn:
+                existing = [row[0] for row in conn.execute(
+                    f"SELECT name FROM sqlite_master WHERE type='table' AND name IN ({placeholders})",
+                    tables
+                )]
+                if not existing:
+                    return None
+                # ISO dates compare correctly as strings, so one MAX covers every table
+                latest = conn.execute(
+                    "SELECT MAX(latest_date) FROM ("
+                    + " UNION ALL ".join(
+                        f"SELECT MAX(ingestion_date) AS latest_date FROM {table}" for table in existing
+                    )
+                    + ")"
+                ).fetchone()[0]
+            if latest is None:
                 return None
-            latest = max(latest_dates)
-            return latest.date() if hasattr(latest, 'date') else latest
+            return datetime.fromisoformat(str(latest)).date()
         except Exception as e:
             print(f"Error getting latest ingestion date: {str(e)}")
             return None
-        finally:
-            if conn is not None:
-                conn.close()
+
+    @_memoized_report
+    def _distinct_study_processes(self):
+        """Query the normalized study process list; errors propagate so they are not cached"""
+        # Filtering each branch lets every table answer from its study process
+        # index; UNION already dedupes. withdrawn_projects names the column differently.
+        withdrawn_col = _quote_identifier(WITHDRAWN_STUDY_PROCESS_COL)
+        query = f"""
+            SELECT study_process FROM grid_generation_queue WHERE study_process IS NOT NULL
+            UNION
+            SELECT study_process FROM completed_projects WHERE study_process IS NOT NULL
+            UNION
+            SELECT {withdrawn_col} AS study_process FROM withdrawn_projects
+            WHERE {withdrawn_col} IS NOT NULL
+        """
+        with self._checkout() as conn:
+            df = _read_frame(query, conn)
+        raw_values = [value for value in df['study_process'].tolist() if value is not None]
+        result = []
+        seen = set()
+        for value in raw_values:
+            normalized = str(value).strip()
+            if not normalized or normalized in seen:
+                continue
+            seen.add(normalized)
+            result.append(normalized)
+
+        # Keep cluster filters current: if data currently tops out at C14, include C15 for next cycle.
+        cluster_numbers = []
+        for value in result:
+            cluster_match = re.fullmatch(r"C0*(\d+)", value)
+            if cluster_match:
+                cluster_numbers.append(int(cluster_match.group(1)))
+        if cluster_numbers and max(cluster_numbers) >= 14 and "C15" not in seen:
+            result.append("C15")
+
+        result.sort(key=_study_process_sort_key)
+        print(f"DEBUG: Found {len(result)} study processes: {result}")
+        return result
 
     def get_study_processes(self):
         """Get list of distinct study process values across all tables
@@ -582,53 +1078,47 @@ class DataLoader:
         Returns:
             list: Sorted list of unique study process values
         """
-        conn = None
         try:
-            conn = self.get_conn()
-            # Note: withdrawn_projects table has different column name
-            query = """
-                SELECT DISTINCT study_process
-                FROM (
-                    SELECT study_process FROM grid_generation_queue
-                    UNION
-                    SELECT study_process FROM completed_projects
-                    UNION
-                    SELECT "Unnamed: 6_level_0 Study
-Process" as study_process FROM withdrawn_projects
-                )
-                WHERE study_process IS NOT NULL
-            """
-            df = pd.read_sql(query, conn)
-            raw_values = [value for value in df['study_process'].tolist() if value is not None]
-            result = []
-            seen = set()
-            for value in raw_values:
-                normalized = str(value).strip()
-                if not normalized or normalized in seen:
-                    continue
-                seen.add(normalized)
-                result.append(normalized)
-
-            # Keep cluster filters current: if data currently tops out at C14, include C15 for next cycle.
-            cluster_numbers = []
-            for value in result:
-                cluster_match = re.fullmatch(r"C0*(\d+)", value)
-                if cluster_match:
-                    cluster_numbers.append(int(cluster_match.group(1)))
-            if cluster_numbers and max(cluster_numbers) >= 14 and "C15" not in seen:
-                result.append("C15")
-
-            result.sort(key=_study_process_sort_key)
-            print(f"DEBUG: Found {len(result)} study processes: {result}")
-            return result
+            return self._distinct_study_processes()
         except Exception as e:
             import traceback
             print(f"Error getting study processes: {str(e)}")
             print(f"Traceback: {traceback.format_exc()}")
             return []
-        finally:
-            if conn is not None:
-                conn.close()
+
+    @_memoized_report
+    def _study_process_summary_for(self, study_processes):
+        """Query per study process totals; errors propagate so they are not cached"""
+        # One outer filter with one set of params; SQLite pushes it down into
+        # each UNION ALL branch, where the study process indexes serve it
+        where_clause = "WHERE study_process IS NOT NULL"
+        params = []
+        if study_processes:
+            where_clause = _study_process_filter(len(study_processes))
+            params = list(study_processes)
+
+        # withdrawn_projects has different column name
+        query = f"""
+            SELECT
+                study_process,
+                COUNT(*) as project_count,
+                SUM(net_mw) as total_mw
+            FROM (
+                SELECT study_process, net_mw FROM grid_generation_queue
+                UNION ALL
+                SELECT study_process, net_mw FROM completed_projects
+                UNION ALL
+                SELECT {_quote_identifier(WITHDRAWN_STUDY_PROCESS_COL)} as study_process, net_mw
+                FROM withdrawn_projects
+            )
+            {where_clause}
+            GROUP BY study_process
+            ORDER BY project_count DESC
+        """
+
+        with self._checkout() as conn:
+            df = _read_frame(query, conn, params=params)
+        return _with_categories(df)
 
     def get_study_process_summary(self, study_processes=None):
         """Get summary statistics by study process
@@ -639,70 +1129,25 @@ Process" as study_process FROM withdrawn_projects
         Returns:
             pd.DataFrame: Summary with columns [study_process, project_count, total_mw]
         """
-        conn = None
         try:
-            conn = self.get_conn()
-
-            # Build WHERE clause if filtering
-            where_clause_active = ""
-            where_clause_withdrawn = ""
-            if study_processes:
-                placeholders = ','.join(['?' for _ in study_processes])
-                where_clause_active = f"WHERE study_process IN ({placeholders})"
-                # withdrawn_projects has different column name
-                where_clause_withdrawn = f'WHERE "Unnamed: 6_level_0 Study\nProcess" IN ({placeholders})'
-
-            # Query all tables
-            query = f"""
-                SELECT
-                    study_process,
-                    COUNT(*) as project_count,
-                    SUM(net_mw) as total_mw
-                FROM (
-                    SELECT study_process, net_mw FROM grid_generation_queue {where_clause_active}
-                    UNION ALL
-                    SELECT study_process, net_mw FROM completed_projects {where_clause_active}
-                    UNION ALL
-                    SELECT "Unnamed: 6_level_0 Study\nProcess" as study_process, net_mw FROM withdrawn_projects {where_clause_withdrawn}
-                )
-                WHERE study_process IS NOT NULL
-                GROUP BY study_process
-                ORDER BY project_count DESC
-            """
-
-            # Execute query with parameters if filtering
-            if study_processes:
-                # Need to pass parameters 3 times (once for each table)
-                params = study_processes * 3
-                df = pd.read_sql(query, conn, params=params)
-            else:
-                df = pd.read_sql(query, conn)
-
-            return df
+            return self._study_process_summary_for(study_processes)
         except Exception as e:
             print(f"Error getting study process summary: {str(e)}")
             return pd.DataFrame(columns=['study_process', 'project_count', 'total_mw'])
-        finally:
-            if conn is not None:
-                conn.close()
 
     def get_cluster15_projects(self):
         """Get all Cluster 15 interconnection request projects."""
-        conn = None
         try:
-            conn = self.get_conn()
-            exists = conn.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='cluster_15_requests'"
-            ).fetchone()
-            if not exists:
-                return pd.DataFrame()
-            return pd.read_sql("SELECT * FROM cluster_15_requests", conn)
+            with self._checkout() as conn:
+                exists = conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='table' AND name='cluster_15_requests'"
+                ).fetchone()
+                if not exists:
+                    return pd.DataFrame()
+                return _with_categories(_read_frame("SELECT * FROM cluster_15_requests", conn))
         except Exception as e:
             print(f"Error in get_cluster15_projects: {str(e)}")
             return pd.DataFrame()
-        finally:
-            if conn is not None:
-                conn.close()
 
     def get_cluster15_summary(self):
         """Get summary statistics for Cluster 15 projects.
@@ -710,47 +1155,39 @@ Process" as study_process FROM withdrawn_projects
         Returns:
             dict with keys: total_projects, total_mw
         """
-        conn = None
         try:
-            conn = self.get_conn()
-            exists = conn.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='cluster_15_requests'"
-            ).fetchone()
-            if not exists:
-                return {'total_projects': 0, 'total_mw': 0.0}
-            row = conn.execute(
-                "SELECT COUNT(*), COALESCE(SUM(net_mw), 0) FROM cluster_15_requests"
-            ).fetchone()
-            return {'total_projects': row[0], 'total_mw': row[1]}
+            with self._checkout() as conn:
+                exists = conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='table' AND name='cluster_15_requests'"
+                ).fetchone()
+                if not exists:
+                    return {'total_projects': 0, 'total_mw': 0.0}
+                row = conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(net_mw), 0) FROM cluster_15_requests"
+                ).fetchone()
+                return {'total_projects': row[0], 'total_mw': row[1]}
         except Exception as e:
             print(f"Error in get_cluster15_summary: {str(e)}")
             return {'total_projects': 0, 'total_mw': 0.0}
-        finally:
-            if conn is not None:
-                conn.close()
 
     def get_cluster15_capacity_by_fuel(self):
         """Get Cluster 15 capacity broken down by fuel type."""
-        conn = None
         try:
-            conn = self.get_conn()
-            exists = conn.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='cluster_15_requests'"
-            ).fetchone()
-            if not exists:
-                return pd.DataFrame(columns=['fuel', 'total_mw'])
-            df = pd.read_sql(
-                """
-                SELECT fuel_types AS fuel, SUM(net_mw) AS total_mw
-                FROM cluster_15_requests
-                GROUP BY fuel_types
-                ORDER BY total_mw DESC
-                """, conn
-            )
-            return df
+            with self._checkout() as conn:
+                exists = conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='table' AND name='cluster_15_requests'"
+                ).fetchone()
+                if not exists:
+                    return pd.DataFrame(columns=['fuel', 'total_mw'])
+                df = _read_frame(
+                    """
+                    SELECT fuel_types AS fuel, SUM(net_mw) AS total_mw
+                    FROM cluster_15_requests
+                    GROUP BY fuel_types
+                    ORDER BY total_mw DESC
+                    """, conn
+                )
+                return _with_categories(df)
         except Exception as e:
             print(f"Error in get_cluster15_capacity_by_fuel: {str(e)}")
             return pd.DataFrame(columns=['fuel', 'total_mw'])
-        finally:
-            if conn is not None:
-                conn.close()
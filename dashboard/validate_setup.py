@@ -3,19 +3,20 @@ Utility script to validate the dashboard setup
 """
 import os
 import sys
-import importlib.util
+import importlib.metadata
 
 def check_requirements():
     """Check if required packages are installed"""
     required_packages = ['streamlit', 'plotly', 'pandas', 'sqlite3']
-    missing_packages = []
-    
-    for package in required_packages:
-        if package == 'sqlite3':  # sqlite3 is part of standard library
-            continue
-        spec = importlib.util.find_spec(package)
-        if spec is None:
-            missing_packages.append(package)
+    # One pass over installed distributions instead of a sys.path search per package
+    installed = {
+        (dist.metadata['Name'] or '').lower() for dist in importlib.metadata.distributions()
+    }
+    # sqlite3 is part of standard library
+    missing_packages = [
+        package for package in required_packages
+        if package != 'sqlite3' and package.lower() not in installed
+    ]
     
     if missing_packages:
         print(f"❌ Missing required packages: {', '.join(missing_packages)}")
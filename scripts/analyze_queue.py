@@ -1,9 +1,12 @@
 """
 Analysis script for CAISO queue data
 """
+import csv
+import json
 import pandas as pd
 import sqlite3
 import os
+import sys
 
 
 def _safe_float(value, default=0.0):
@@ -28,27 +31,128 @@ def _safe_int(value, default=0):
 DB_FILE = 'data/caiso_queue.db'
 REPORTS_DIR = 'reports'
 
+# Connection settings for the analysis run: a 64 MiB page cache, in-memory
+# temp storage for GROUP BY/ORDER BY sorts, and memory-mapped reads
+ANALYSIS_PRAGMAS = (
+    'cache_size=-65536',
+    'temp_store=MEMORY',
+    'mmap_size=268435456',
+)
+
+# Latest ingestion date per (database file, modification time, table)
+_latest_dates = {}
+
+
+def _latest_date(conn, table):
+    """Return a table's latest ingestion date, looked up once per database version.
+
+    Every analysis filters on the newest snapshot; caching the MAX keeps the
+    analyses from each re-running it as a subquery. The key includes the
+    file's modification time, so a reloaded database is looked up again.
+    """
+    db_path = conn.execute("PRAGMA database_list").fetchone()[2]
+    if not db_path:  # in-memory databases have no file to version by
+        return conn.execute(f"SELECT MAX(ingestion_date) FROM {table}").fetchone()[0]
+    key = (db_path, os.path.getmtime(db_path), table)
+    if key not in _latest_dates:
+        _latest_dates[key] = conn.execute(f"SELECT MAX(ingestion_date) FROM {table}").fetchone()[0]
+    return _latest_dates[key]
+
+
+def _floored_days(later, earlier):
+    """SQL for the whole days between two date columns, floored like pandas Timedelta.days."""
+    days = f"(julianday({later}) - julianday({earlier}))"
+    return f"(CAST({days} AS INTEGER) - ({days} < CAST({days} AS INTEGER)))"
+
+
+def _latest_snapshot(conn, table):
+    """Materialize a table's latest ingestion slice as a temp table; return its name.
+
+    The queue analyses all read the same snapshot, so it is filtered once per
+    connection and shared. A newer ingestion date triggers a rebuild.
+    """
+    snapshot = f"latest_{table}"
+    latest = _latest_date(conn, table)
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_temp_master WHERE type='table' AND name=?", (snapshot,)
+    ).fetchone()
+    if exists:
+        built_for = conn.execute(f"SELECT ingestion_date FROM temp.{snapshot} LIMIT 1").fetchone()
+        if (built_for[0] if built_for else None) == latest:
+            return f"temp.{snapshot}"
+        conn.execute(f"DROP TABLE temp.{snapshot}")
+    conn.execute(
+        f"CREATE TEMP TABLE {snapshot} AS SELECT * FROM {table} WHERE ingestion_date = ?",
+        (latest,)
+    )
+    return f"temp.{snapshot}"
+
 # Ensure reports directory exists
 os.makedirs(REPORTS_DIR, exist_ok=True)
 
+# Write buffer for report files
+REPORT_BUFFER_BYTES = 1 << 20
+
+# Records, per analysis, the source data its reports were last built from
+MANIFEST_FILE = '.manifest.json'
+
+# Tables whose latest snapshot the analyses read
+SOURCE_TABLES = ('grid_generation_queue', 'completed_projects', 'withdrawn_projects')
+
+# Report files written by each analysis; each analysis returns the ones it wrote
+ANALYSIS_REPORTS = {
+    'capacity_by_fuel': ('capacity_by_fuel.csv',),
+    'project_count_by_status': ('project_count_by_status.csv',),
+    'top5_iso_zones': ('top5_iso_zones.csv',),
+    'cancellation_rate': ('cancellation_rate.csv',),
+    'average_lead_time': ('average_lead_time.csv',),
+    'top_projects_by_net_mw': ('top_projects_by_net_mw.csv',),
+    'timeline_delay_analysis': (
+        'project_timeline_delays.csv', 'timeline_delay_summary.csv', 'timeline_delay_by_fuel.csv'
+    ),
+}
+
+
+def _write_report(df, filename):
+    """Write a report DataFrame to REPORTS_DIR through one large buffered handle.
+
+    Returns the filename, so analyses can report what they wrote.
+    """
+    os.makedirs(REPORTS_DIR, exist_ok=True)
+    path = os.path.join(REPORTS_DIR, filename)
+    with open(path, 'w', newline='', buffering=REPORT_BUFFER_BYTES) as f:
+        df.to_csv(f, index=False, lineterminator='\n')
+    return filename
+
+
+def _write_summary(row, filename):
+    """Write a one-row summary report with csv.writer, without building a DataFrame.
+
+    Missing values are written as empty fields, as DataFrame.to_csv does.
+    Returns the filename, like _write_report.
+    """
+    os.makedirs(REPORTS_DIR, exist_ok=True)
+    with open(os.path.join(REPORTS_DIR, filename), 'w', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(row.keys())
+        writer.writerow('' if pd.isna(value) else value for value in row.values())
+    return filename
+
 # 1: Capacity by fuel types
 def capacity_by_fuel(conn):
     """
     Analyze total capacity by different fuel types in the generation queue
     """
     df = pd.read_sql(
-        """
+        f"""
         SELECT fuel_types AS fuel, SUM(mw_1) AS total_mw
-        FROM grid_generation_queue
-        WHERE ingestion_date = (
-            SELECT MAX(ingestion_date) FROM grid_generation_queue
-        )
+        FROM {_latest_snapshot(conn, 'grid_generation_queue')}
         GROUP BY fuel_types
         """, conn
     )
-    os.makedirs(REPORTS_DIR, exist_ok=True)
-    df.to_csv(os.path.join(REPORTS_DIR, 'capacity_by_fuel.csv'), index=False)
+    report = _write_report(df, 'capacity_by_fuel.csv')
     print(f"Generated capacity by fuel report with {len(df)} fuel types")
+    return [report]
 
 # 2: Project count & capacity by status
 def project_count_by_status(conn):
@@ -56,15 +160,12 @@ def project_count_by_status(conn):
     Provide overview of projects by status (Active, Completed, Withdrawn)
     """
     df = pd.read_sql(
-        """
+        f"""
         SELECT
             'Active' as status,
             COUNT(*) AS project_count,
             SUM(mw_1) AS total_mw
-        FROM grid_generation_queue
-        WHERE ingestion_date = (
-            SELECT MAX(ingestion_date) FROM grid_generation_queue
-        )
+        FROM {_latest_snapshot(conn, 'grid_generation_queue')}
 
         UNION ALL
 
@@ -73,9 +174,7 @@ def project_count_by_status(conn):
             COUNT(*) AS project_count,
             SUM(mw_1) AS total_mw
         FROM completed_projects
-        WHERE ingestion_date = (
-            SELECT MAX(ingestion_date) FROM completed_projects
-        )
+        WHERE ingestion_date = ?
 
         UNION ALL
 
@@ -84,14 +183,15 @@ def project_count_by_status(conn):
             COUNT(*) AS project_count,
             SUM(mw_1) AS total_mw
         FROM withdrawn_projects
-        WHERE ingestion_date = (
-            SELECT MAX(ingestion_date) FROM withdrawn_projects
+        WHERE ingestion_date = ?
+        """, conn, params=(
+            _latest_date(conn, 'completed_projects'),
+            _latest_date(conn, 'withdrawn_projects'),
         )
-        """, conn
     )
-    os.makedirs(REPORTS_DIR, exist_ok=True)
-    df.to_csv(os.path.join(REPORTS_DIR, 'project_count_by_status.csv'), index=False)
+    report = _write_report(df, 'project_count_by_status.csv')
     print(f"Generated project count by status report with {len(df)} statuses")
+    return [report]
 
 # 3: Top 5 ISO Zones by active capacity
 def top5_iso_zones(conn):
@@ -99,90 +199,60 @@ def top5_iso_zones(conn):
     Identify top 5 ISO regions with the highest active generation capacity
     """
     df = pd.read_sql(
-        """
+        f"""
         SELECT pto_study_region AS iso_zone, SUM(mw_1) AS total_mw
-        FROM grid_generation_queue
-        WHERE ingestion_date = (
-            SELECT MAX(ingestion_date) FROM grid_generation_queue
-        )
+        FROM {_latest_snapshot(conn, 'grid_generation_queue')}
         GROUP BY pto_study_region
         ORDER BY total_mw DESC
         LIMIT 5
         """, conn
     )
-    os.makedirs(REPORTS_DIR, exist_ok=True)
-    df.to_csv(os.path.join(REPORTS_DIR, 'top5_iso_zones.csv'), index=False)
+    report = _write_report(df, 'top5_iso_zones.csv')
     print(f"Generated top 5 ISO zones report with the highest capacity regions")
+    return [report]
 
 # 4: Cancellation rate
 def cancellation_rate(conn):
     """
     Calculate ratio of withdrawn project capacity to total capacity
     """
-    # Get active MW from active projects
-    active_result = pd.read_sql(
-        """
-        SELECT SUM(mw_1) AS total_mw
-        FROM grid_generation_queue
-        WHERE ingestion_date = (
-            SELECT MAX(ingestion_date) FROM grid_generation_queue
-        )
+    # Active, completed and withdrawn MW in one round trip
+    active_result, completed_result, withdrawn_result = conn.execute(
+        f"""
+        SELECT
+            (SELECT SUM(mw_1) FROM {_latest_snapshot(conn, 'grid_generation_queue')}),
+            (SELECT SUM(mw_1) FROM completed_projects WHERE ingestion_date = ?),
+            (SELECT SUM(mw_1) FROM withdrawn_projects WHERE ingestion_date = ?)
         """,
-        conn
-    ).iloc[0,0]
+        (_latest_date(conn, 'completed_projects'), _latest_date(conn, 'withdrawn_projects'))
+    ).fetchone()
     active = _safe_float(active_result)
-    
-    # Get completed MW from completed projects
-    completed_result = pd.read_sql(
-        """
-        SELECT SUM(mw_1) AS total_mw
-        FROM completed_projects
-        WHERE ingestion_date = (
-            SELECT MAX(ingestion_date) FROM completed_projects
-        )
-        """,
-        conn
-    ).iloc[0,0]
     completed = _safe_float(completed_result)
-
-    # Get total MW from withdrawn projects
-    withdrawn_result = pd.read_sql(
-        """
-        SELECT SUM(mw_1) AS withdrawn_mw
-        FROM withdrawn_projects
-        WHERE ingestion_date = (
-            SELECT MAX(ingestion_date) FROM withdrawn_projects
-        )
-        """,
-        conn
-    ).iloc[0,0]
     withdrawn = _safe_float(withdrawn_result)
     
     total = active + completed + withdrawn
     rate = withdrawn / total if total else None
-    os.makedirs(REPORTS_DIR, exist_ok=True)
-    pd.DataFrame([{'cancellation_rate': rate}]).to_csv(os.path.join(REPORTS_DIR, 'cancellation_rate.csv'), index=False)
+    report = _write_summary({'cancellation_rate': rate}, 'cancellation_rate.csv')
     print(f"Generated cancellation rate report: {rate:.2%}" if rate else "Generated cancellation rate report: N/A")
+    return [report]
 
 # 5: Average lead time (days)
 def average_lead_time(conn):
     """
     Measure average days between interconnection request receipt and queue position assignment
     """
-    df = pd.read_sql(
-        "SELECT queue_date AS Queue_Date, "
-        "request_receive_date AS Request_Received_Date "
-        "FROM grid_generation_queue "
-        "WHERE queue_date IS NOT NULL AND "
-        "request_receive_date IS NOT NULL AND "
-        "ingestion_date = (SELECT MAX(ingestion_date) FROM grid_generation_queue)", conn,
-        parse_dates=['Queue_Date','Request_Received_Date']
-    )
-    df['lead_time'] = (df['Queue_Date'] - df['Request_Received_Date']).dt.days
-    avg = df['lead_time'].mean()
-    os.makedirs(REPORTS_DIR, exist_ok=True)
-    pd.DataFrame([{'average_lead_time_days': avg}]).to_csv(os.path.join(REPORTS_DIR, 'average_lead_time.csv'), index=False)
-    print(f"Generated average lead time report: {avg:.1f} days based on {len(df)} projects")
+    # Days are floored like pandas Timedelta.days before averaging
+    avg, project_count = conn.execute(
+        f"""
+        SELECT AVG({_floored_days('queue_date', 'request_receive_date')}), COUNT(*)
+        FROM {_latest_snapshot(conn, 'grid_generation_queue')}
+        WHERE queue_date IS NOT NULL AND request_receive_date IS NOT NULL
+        """
+    ).fetchone()
+    avg = float('nan') if avg is None else avg
+    report = _write_summary({'average_lead_time_days': avg}, 'average_lead_time.csv')
+    print(f"Generated average lead time report: {avg:.1f} days based on {project_count} projects")
+    return [report]
 
 # 6: Top 10 projects by Net MWs to Grid
 def top_projects_by_net_mw(conn):
@@ -190,7 +260,7 @@ def top_projects_by_net_mw(conn):
     Identify the largest generation projects based on net MW contribution
     """    
     df = pd.read_sql(
-        """
+        f"""
         SELECT 
             project_name,
             queue_position,
@@ -199,19 +269,16 @@ def top_projects_by_net_mw(conn):
             'Active' AS status,
             county,
             state
-        FROM grid_generation_queue
+        FROM {_latest_snapshot(conn, 'grid_generation_queue')}
         WHERE net_mw IS NOT NULL
-        AND ingestion_date = (
-            SELECT MAX(ingestion_date) FROM grid_generation_queue
-        )
         GROUP BY project_name, queue_position
         ORDER BY MAX(net_mw) DESC
         LIMIT 10
         """, conn
     )
-    os.makedirs(REPORTS_DIR, exist_ok=True)
-    df.to_csv(os.path.join(REPORTS_DIR, 'top_projects_by_net_mw.csv'), index=False)
+    report = _write_report(df, 'top_projects_by_net_mw.csv')
     print(f"Generated top projects by net MW report with {len(df)} unique projects")
+    return [report]
 
 # 7: Project timeline delay analysis
 def timeline_delay_analysis(conn):
@@ -219,34 +286,32 @@ def timeline_delay_analysis(conn):
     Measure difference between originally proposed and current online dates
     """
     # Using the renamed columns directly now
-    query = """
-    SELECT
-        project_name,
-        queue_position,
-        proposed_online_date,
-        current_online_date,
-        fuel_types
-    FROM grid_generation_queue
-    WHERE proposed_online_date IS NOT NULL
-    AND current_online_date IS NOT NULL
-    AND ingestion_date = (
-        SELECT MAX(ingestion_date) FROM grid_generation_queue
-    )
-    """
-    
+    delay_days = _floored_days('current_online_date', 'proposed_online_date')
     try:
-        df = pd.read_sql(query, conn, parse_dates=['proposed_online_date', 'current_online_date'])
+        snapshot = _latest_snapshot(conn, 'grid_generation_queue')
+        query = f"""
+        SELECT
+            project_name,
+            queue_position,
+            proposed_online_date,
+            current_online_date,
+            fuel_types,
+            {delay_days} AS delay_days
+        FROM {snapshot}
+        WHERE proposed_online_date IS NOT NULL
+        AND current_online_date IS NOT NULL
+        """
+        # delay_days arrives computed, so the dates are passed through unparsed
+        df = pd.read_sql(query, conn)
         print(f"Retrieved {len(df)} projects with timeline data")
     except Exception as e:
         print(f"Error executing timeline delay query: {str(e)}")
-        return
+        return []
             
-    # Calculate the difference in days between proposed and current online dates
+    # delay_days is the floored day difference between current and proposed online dates
     if len(df) == 0:
         print("No data available for timeline delay analysis")
-        return
-        
-    df['delay_days'] = (df['current_online_date'] - df['proposed_online_date']).dt.days
+        return []
     
     # Generate summary statistics
     delay_stats = {
@@ -263,19 +328,27 @@ def timeline_delay_analysis(conn):
     total_projects = len(df)
     delay_stats['delay_percentage'] = (delay_stats['positive_delay_count'] / total_projects) * 100 if total_projects > 0 else 0
     
-    # Calculate average delay by fuel type
-    fuel_delays = df.groupby('fuel_types')['delay_days'].mean().reset_index()
-    fuel_delays.columns = ['fuel_type', 'average_delay_days']
-
-    # Save detailed project-level data
-    os.makedirs(REPORTS_DIR, exist_ok=True)
-    df.to_csv(os.path.join(REPORTS_DIR, 'project_timeline_delays.csv'), index=False)
-
-    # Save summary statistics
-    pd.DataFrame([delay_stats]).to_csv(os.path.join(REPORTS_DIR, 'timeline_delay_summary.csv'), index=False)
+    # Calculate average delay by fuel type in SQL
+    fuel_delays = pd.read_sql(
+        f"""
+        SELECT fuel_types AS fuel_type, AVG({delay_days}) AS average_delay_days
+        FROM {snapshot}
+        WHERE proposed_online_date IS NOT NULL
+        AND current_online_date IS NOT NULL
+        AND fuel_types IS NOT NULL
+        GROUP BY fuel_types
+        ORDER BY fuel_types
+        """, conn
+    )
 
-    # Save fuel type analysis
-    fuel_delays.to_csv(os.path.join(REPORTS_DIR, 'timeline_delay_by_fuel.csv'), index=False)
+    reports = [
+        # Save detailed project-level data
+        _write_report(df, 'project_timeline_delays.csv'),
+        # Save summary statistics
+        _write_summary(delay_stats, 'timeline_delay_summary.csv'),
+        # Save fuel type analysis
+        _write_report(fuel_delays, 'timeline_delay_by_fuel.csv'),
+    ]
     
     print(f"Generated timeline delay analysis with data from {len(df)} projects:")
     print(f"  - Average delay: {delay_stats['average_delay_days']:.1f} days")
@@ -284,6 +357,7 @@ def timeline_delay_analysis(conn):
     print(f"  - Projects delayed: {delay_stats['positive_delay_count']} ({delay_stats['delay_percentage']:.1f}%)")
     print(f"  - Projects accelerated: {delay_stats['negative_delay_count']}")
     print(f"  - Projects on schedule: {delay_stats['no_change_count']}")
+    return reports
 
 # Helper function to validate data quality
 def validate_data_quality(conn):
@@ -296,10 +370,9 @@ def validate_data_quality(conn):
     
     # Check for all main tables
     required_tables = ['grid_generation_queue', 'completed_projects', 'withdrawn_projects']
-    existing_tables = pd.read_sql(
-        "SELECT name FROM sqlite_master WHERE type='table'", 
-        conn
-    )['name'].tolist()
+    existing_tables = {
+        row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+    }
     
     for table in required_tables:
         if table not in existing_tables:
@@ -317,7 +390,7 @@ def validate_data_quality(conn):
             else:
                 project_name_cols = ['project_name']
                 
-            cols = pd.read_sql(f"PRAGMA table_info({table})", conn)['name'].tolist()
+            cols = [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
             
             # Check for standard columns
             for col in key_columns:
@@ -329,43 +402,37 @@ def validate_data_quality(conn):
             if not any(col in cols for col in project_name_cols):
                 print(f"ISSUE: No project name column found in {table}")
                 validation_issues += 1
-              # Check for null values in important columns
-            row_count_result = pd.read_sql(
-                f"SELECT COUNT(*) as count FROM {table}",
-                conn
-            ).iloc[0,0]
-            row_count = _safe_int(row_count_result)
-            if row_count > 0:
-                # Check queue_position
-                if 'queue_position' in cols:
-                    null_count_result = pd.read_sql(
-                        f"SELECT COUNT(*) as count FROM {table} WHERE queue_position IS NULL OR queue_position = ''",
-                        conn
-                    ).iloc[0,0]
-                    null_count = _safe_int(null_count_result)
-                    if null_count > 0:
-                        pct = (null_count / row_count) * 100
-                        print(f"ISSUE: {null_count} rows ({pct:.1f}%) have null values in queue_position in {table}")
-                        validation_issues += 1
-                
-                # Check project_name (with special handling for withdrawn_projects)
-                if table == 'withdrawn_projects':
-                    if 'Unnamed: 0_level_0 Project Name - Confidential' in cols:
-                        project_col = 'Unnamed: 0_level_0 Project Name - Confidential'
-                    else:
-                        project_col = 'project_name'
+            
+            # Check for null values in queue_position and the project name column
+            # (with special handling for withdrawn_projects)
+            if table == 'withdrawn_projects':
+                if 'Unnamed: 0_level_0 Project Name - Confidential' in cols:
+                    project_col = 'Unnamed: 0_level_0 Project Name - Confidential'
                 else:
                     project_col = 'project_name'
-                
-                if project_col in cols:
-                    null_count_result = pd.read_sql(
-                        f"SELECT COUNT(*) as count FROM {table} WHERE {project_col} IS NULL OR {project_col} = ''",
-                        conn
-                    ).iloc[0,0]
+            else:
+                project_col = 'project_name'
+            null_checks = [
+                (col, label)
+                for col, label in (('queue_position', 'queue_position'), (project_col, 'project name column'))
+                if col in cols
+            ]
+            
+            # Row count and every null count in one pass over the table
+            blank_counts = ''.join(
+                f", SUM(CASE WHEN \"{col}\" IS NULL OR \"{col}\" = '' THEN 1 ELSE 0 END)"
+                for col, _ in null_checks
+            )
+            row_count_result, *null_count_results = conn.execute(
+                f"SELECT COUNT(*){blank_counts} FROM {table}"
+            ).fetchone()
+            row_count = _safe_int(row_count_result)
+            if row_count > 0:
+                for (_, label), null_count_result in zip(null_checks, null_count_results):
                     null_count = _safe_int(null_count_result)
                     if null_count > 0:
                         pct = (null_count / row_count) * 100
-                        print(f"ISSUE: {null_count} rows ({pct:.1f}%) have null values in project name column in {table}")
+                        print(f"ISSUE: {null_count} rows ({pct:.1f}%) have null values in {label} in {table}")
                         validation_issues += 1
             else:
                 print(f"INFO: Table {table} is empty (0 rows)")
@@ -382,9 +449,60 @@ def validate_data_quality(conn):
     return validation_issues
 
 
+def _source_signature(conn):
+    """Describe the data the analyses read: each table's latest ingestion date.
+
+    The database modification time is included so a same-day re-ingest,
+    which keeps the ingestion date, still counts as new data.
+    """
+    signature = {table: _latest_date(conn, table) for table in SOURCE_TABLES}
+    signature['db_mtime'] = os.path.getmtime(DB_FILE)
+    return signature
+
+
+def _load_manifest():
+    """Return the report manifest, or an empty one if it is missing or unreadable."""
+    try:
+        with open(os.path.join(REPORTS_DIR, MANIFEST_FILE)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(manifest):
+    """Write the report manifest next to the reports."""
+    os.makedirs(REPORTS_DIR, exist_ok=True)
+    with open(os.path.join(REPORTS_DIR, MANIFEST_FILE), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def _discard_reports(filenames):
+    """Delete report files left over from an earlier run."""
+    for filename in filenames:
+        try:
+            os.remove(os.path.join(REPORTS_DIR, filename))
+        except FileNotFoundError:
+            pass
+
+
+def _reports_current(manifest, analysis_name, signature):
+    """Check whether an analysis's reports exist and were built from this source data."""
+    return (
+        manifest.get(analysis_name) == signature
+        and all(
+            os.path.exists(os.path.join(REPORTS_DIR, filename))
+            for filename in ANALYSIS_REPORTS[analysis_name]
+        )
+    )
+
+
 # Main analysis function
-def main():
-    """Run all analysis functions and generate reports."""
+def main(force=False):
+    """Run all analysis functions and generate reports.
+
+    Args:
+        force (bool): Regenerate every report even if its source data is unchanged
+    """
     print("Starting analysis...")
     
     if not os.path.exists(DB_FILE):
@@ -394,22 +512,23 @@ def main():
         
     try:
         conn = sqlite3.connect(DB_FILE)
+        for pragma in ANALYSIS_PRAGMAS:
+            conn.execute(f"PRAGMA {pragma}")
         print(f"Connected to database: {DB_FILE}")
         
         # Check if tables exist
-        tables = pd.read_sql(
-            "SELECT name FROM sqlite_master WHERE type='table'", 
-            conn
-        )
+        tables = [
+            row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        ]
         print(f"Found {len(tables)} tables in database:")
-        for idx, table in enumerate(tables['name']):
+        for idx, table in enumerate(tables):
             print(f"  {idx+1}. {table}")
             
         # Try to get column names from grid_generation_queue table
         try:
-            cols = pd.read_sql("PRAGMA table_info(grid_generation_queue)", conn)
+            cols = [row[1] for row in conn.execute("PRAGMA table_info(grid_generation_queue)")]
             print(f"\nFound {len(cols)} columns in grid_generation_queue table")
-            print("First 5 columns:", cols['name'][:5].tolist())
+            print("First 5 columns:", cols[:5])
         except Exception as e:
             print(f"Error getting columns: {str(e)}")
             
@@ -426,18 +545,42 @@ def main():
             ('timeline_delay_analysis', timeline_delay_analysis)
         ]
         
+        # Skip analyses whose reports were already built from the current data
+        try:
+            signature = _source_signature(conn)
+        except Exception as e:
+            print(f"Could not read source ingestion dates, regenerating all reports: {str(e)}")
+            signature = None
+        manifest = {} if force or signature is None else _load_manifest()
+        
         success_count = 0
         for analysis_name, analysis_func in analysis_functions:
-            try:
-                print(f"\nRunning analysis: {analysis_name}")
-                analysis_func(conn)
+            if signature is not None and _reports_current(manifest, analysis_name, signature):
+                print(f"\nSkipping analysis: {analysis_name} (reports are up to date)")
                 success_count += 1
+                continue
+            print(f"\nRunning analysis: {analysis_name}")
+            written = []
+            try:
+                written = analysis_func(conn)
             except Exception as e:
                 print(f"Error in {analysis_name}: {str(e)}")
                 import traceback
                 traceback.print_exc()
                 print(f"Continuing with next analysis...")
+            # Only reports rewritten in this run may be recorded as current
+            stale = [f for f in ANALYSIS_REPORTS[analysis_name] if f not in written]
+            if stale:
+                manifest.pop(analysis_name, None)
+                _discard_reports(stale)
+                print(f"{analysis_name} did not write {', '.join(stale)}; removed stale reports")
+                continue
+            success_count += 1
+            if signature is not None:
+                manifest[analysis_name] = signature
         
+        if signature is not None:
+            _save_manifest(manifest)
         print(f"\nAnalysis complete - {success_count} of {len(analysis_functions)} analyses completed successfully")
     except Exception as e:
         print(f"Error during analysis: {str(e)}")
@@ -449,4 +592,4 @@ def main():
             print("Connection closed")
 
 if __name__ == '__main__':
-    main()
+    main(force='--force' in sys.argv[1:])
@@ -315,6 +315,29 @@ def parse_sheet(df):
     return df
 
 # Main ingestion
+# Summary of project counts and capacity per status, so unfiltered dashboard
+# views do not scan the project tables
+STATUS_SUMMARY_TABLE = 'agg_status'
+
+def build_status_summary(conn):
+    """
+    Rebuild the agg_status table from the active, completed and withdrawn tables.
+    """
+    with conn:
+        conn.execute(f"DROP TABLE IF EXISTS {STATUS_SUMMARY_TABLE}")
+        conn.execute(f"""
+            CREATE TABLE {STATUS_SUMMARY_TABLE} AS
+            SELECT 'Active' AS status, COUNT(*) AS project_count,
+                   COALESCE(SUM(net_mw), 0) AS total_mw
+            FROM grid_generation_queue
+            UNION ALL
+            SELECT 'Completed', COUNT(*), COALESCE(SUM(net_mw), 0)
+            FROM completed_projects
+            UNION ALL
+            SELECT 'Withdrawn', COUNT(*), COALESCE(SUM(net_mw), 0)
+            FROM withdrawn_projects
+        """)
+
 def main():
     # Ensure data directory exists
     ensure_dirs()
@@ -484,6 +507,62 @@ def main():
                         )
                         print(f"Created index on ingestion_date for {table}")
                         
+                        # Index the columns the dashboard filters and groups by
+                        study_process_col = (
+                            '"Unnamed: 6_level_0 Study\nProcess"'
+                            if table == 'withdrawn_projects' else 'study_process'
+                        )
+                        conn.execute(
+                            f'CREATE INDEX IF NOT EXISTS idx_{table}_fuel_types '
+                            f'ON {table}(fuel_types)'
+                        )
+                        print(f"Created index on fuel_types for {table}")
+                        
+                        # Study-filtered reports read only these covering indexes;
+                        # they also serve plain study process lookups
+                        conn.execute(f'DROP INDEX IF EXISTS idx_{table}_study_process')
+                        conn.execute(
+                            f'CREATE INDEX IF NOT EXISTS idx_{table}_sp_fuel_mw '
+                            f'ON {table}({study_process_col}, fuel_types, net_mw)'
+                        )
+                        conn.execute(
+                            f'CREATE INDEX IF NOT EXISTS idx_{table}_sp_net_mw '
+                            f'ON {table}({study_process_col}, net_mw DESC)'
+                        )
+                        print(f"Created covering study process indexes for {table}")
+                        
+                        # Top projects sort by net_mw; the ISO zone report groups by region
+                        conn.execute(
+                            f'CREATE INDEX IF NOT EXISTS idx_{table}_net_mw '
+                            f'ON {table}(net_mw DESC)'
+                        )
+                        table_cols = {row[1] for row in conn.execute(f'PRAGMA table_info({table})')}
+                        
+                        # analyze_queue sums mw_1 over the latest snapshot, grouped by
+                        # fuel or region; these covering indexes answer it index-only
+                        if 'mw_1' in table_cols:
+                            conn.execute(
+                                f'CREATE INDEX IF NOT EXISTS idx_{table}_ing_mw '
+                                f'ON {table}(ingestion_date, mw_1)'
+                            )
+                            for group_col, suffix in (('fuel_types', 'fuel'), ('pto_study_region', 'region')):
+                                if group_col in table_cols:
+                                    conn.execute(
+                                        f'CREATE INDEX IF NOT EXISTS idx_{table}_ing_{suffix}_mw '
+                                        f'ON {table}(ingestion_date, {group_col}, mw_1)'
+                                    )
+                            print(f"Created snapshot capacity indexes for {table}")
+                        if 'pto_study_region' in table_cols:
+                            conn.execute(
+                                f'CREATE INDEX IF NOT EXISTS idx_{table}_pto_study_region '
+                                f'ON {table}(pto_study_region)'
+                            )
+                            conn.execute(
+                                f'CREATE INDEX IF NOT EXISTS idx_{table}_sp_region_mw '
+                                f'ON {table}({study_process_col}, pto_study_region, net_mw)'
+                            )
+                        print(f"Created indexes on net_mw and pto_study_region for {table}")
+                        
                         # Final verification for duplicates
                         try:
                             duplicate_query = f"""
@@ -512,6 +591,21 @@ def main():
                 print(f"Skipping index creation - {table} table does not exist")
     except Exception as e:
         print(f"Error during index creation: {str(e)}")
+
+    # Rebuild the per-status summary read by the dashboard
+    try:
+        build_status_summary(conn)
+        print(f"Rebuilt {STATUS_SUMMARY_TABLE} summary table")
+    except Exception as e:
+        print(f"Error building {STATUS_SUMMARY_TABLE} summary table: {str(e)}")
+
+    # Refresh planner statistics so the new indexes are used
+    try:
+        conn.execute("ANALYZE")
+        conn.commit()
+        print("Updated query planner statistics")
+    except Exception as e:
+        print(f"Error running ANALYZE: {str(e)}")
     finally:
         conn.close()
 
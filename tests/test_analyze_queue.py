@@ -11,11 +11,19 @@ from pathlib import Path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
 
 from analyze_queue import (
+    _latest_date,
+    _latest_snapshot,
+    _load_manifest,
+    _reports_current,
     _safe_float,
     _safe_int,
+    average_lead_time,
+    cancellation_rate,
     capacity_by_fuel,
+    main,
     project_count_by_status,
     top5_iso_zones,
+    validate_data_quality,
 )
 
 
@@ -70,11 +78,12 @@ class TestCapacityByFuel:
 
         # Mock REPORTS_DIR
         with patch('analyze_queue.REPORTS_DIR', temp_dir):
-            capacity_by_fuel(conn)
+            written = capacity_by_fuel(conn)
 
         conn.close()
 
-        # Check that output file was created
+        # Check that output file was created and reported
+        assert written == ['capacity_by_fuel.csv']
         output_file = os.path.join(temp_dir, 'capacity_by_fuel.csv')
         assert os.path.exists(output_file)
 
@@ -203,6 +212,183 @@ class TestTop5IsoZones:
         assert df['total_mw'].is_monotonic_decreasing or len(df) == 1
 
 
+@pytest.mark.integration
+class TestCancellationRate:
+    """Test suite for cancellation_rate analysis function."""
+
+    def test_cancellation_rate_uses_latest_snapshots(self, temp_db, temp_dir):
+        """Test withdrawn share of total MW across the latest snapshot of each table."""
+        conn = sqlite3.connect(temp_db)
+        pd.DataFrame({
+            'mw_1': [100.0, 999.0],
+            'ingestion_date': ['2025-02-01', '2025-01-01'],
+        }).to_sql('grid_generation_queue', conn, index=False)
+        pd.DataFrame({'mw_1': [50.0], 'ingestion_date': ['2025-02-01']}).to_sql(
+            'completed_projects', conn, index=False
+        )
+        pd.DataFrame({'mw_1': [50.0], 'ingestion_date': ['2025-02-01']}).to_sql(
+            'withdrawn_projects', conn, index=False
+        )
+
+        with patch('analyze_queue.REPORTS_DIR', temp_dir):
+            cancellation_rate(conn)
+        conn.close()
+
+        df = pd.read_csv(os.path.join(temp_dir, 'cancellation_rate.csv'))
+        assert df['cancellation_rate'].iloc[0] == 0.25
+
+
+@pytest.mark.integration
+class TestAverageLeadTime:
+    """Test suite for average_lead_time analysis function."""
+
+    def test_average_lead_time_floors_days_in_sql(self, temp_db, temp_dir):
+        """Test lead times are whole elapsed days, averaged over the latest snapshot."""
+        conn = sqlite3.connect(temp_db)
+        pd.DataFrame({
+            'queue_date': ['2025-01-03 07:00:00', '2025-01-11 00:00:00', '2025-01-09 00:00:00'],
+            'request_receive_date': ['2025-01-01 00:00:00', '2025-01-01 08:00:00', '2025-01-01 00:00:00'],
+            'ingestion_date': ['2025-02-01', '2025-02-01', '2025-01-01'],
+        }).to_sql('grid_generation_queue', conn, index=False)
+
+        with patch('analyze_queue.REPORTS_DIR', temp_dir):
+            average_lead_time(conn)
+        conn.close()
+
+        df = pd.read_csv(os.path.join(temp_dir, 'average_lead_time.csv'))
+        assert df['average_lead_time_days'].iloc[0] == 5.5  # (2 + 9) / 2
+
+
+@pytest.mark.integration
+class TestLatestDate:
+    """Test suite for the cached latest ingestion date lookup."""
+
+    def test_latest_date_refreshes_after_reload(self, temp_db):
+        """Test that a rewritten database is looked up again."""
+        conn = sqlite3.connect(temp_db)
+        pd.DataFrame({'ingestion_date': ['2025-01-01', '2025-02-01']}).to_sql(
+            'grid_generation_queue', conn, index=False
+        )
+        assert _latest_date(conn, 'grid_generation_queue') == '2025-02-01'
+
+        pd.DataFrame({'ingestion_date': ['2025-03-01']}).to_sql(
+            'grid_generation_queue', conn, if_exists='append', index=False
+        )
+        os.utime(temp_db, ns=(0, os.stat(temp_db).st_mtime_ns + 1_000_000_000))
+        assert _latest_date(conn, 'grid_generation_queue') == '2025-03-01'
+        conn.close()
+
+    def test_latest_snapshot_holds_only_the_newest_ingestion(self, temp_db):
+        """Test that the temp snapshot keeps just the latest slice and is reused."""
+        conn = sqlite3.connect(temp_db)
+        pd.DataFrame({
+            'queue_position': ['Z001', 'Z001', 'Z002'],
+            'ingestion_date': ['2025-01-01', '2025-02-01', '2025-02-01'],
+        }).to_sql('grid_generation_queue', conn, index=False)
+
+        snapshot = _latest_snapshot(conn, 'grid_generation_queue')
+        rows = conn.execute(f"SELECT queue_position FROM {snapshot} ORDER BY 1").fetchall()
+        assert rows == [('Z001',), ('Z002',)]
+        assert _latest_snapshot(conn, 'grid_generation_queue') == snapshot
+        conn.close()
+
+
+@pytest.mark.integration
+class TestValidateDataQuality:
+    """Test suite for validate_data_quality."""
+
+    def test_counts_blank_keys_including_confidential_name_column(self, temp_db):
+        """Test null probes, including the withdrawn table's unmapped project name header."""
+        conn = sqlite3.connect(temp_db)
+        base = {'ingestion_date': ['2025-01-01'] * 2, 'mw_1': [1.0, 2.0]}
+        pd.DataFrame({'queue_position': ['Z001', ''], 'project_name': ['A', 'B'], **base}).to_sql(
+            'grid_generation_queue', conn, index=False
+        )
+        pd.DataFrame({'queue_position': ['C001', 'C002'], 'project_name': ['A', 'B'], **base}).to_sql(
+            'completed_projects', conn, index=False
+        )
+        pd.DataFrame({
+            'queue_position': ['W001', 'W002'],
+            'Unnamed: 0_level_0 Project Name - Confidential': ['A', None],
+            **base,
+        }).to_sql('withdrawn_projects', conn, index=False)
+
+        assert validate_data_quality(conn) == 2
+        conn.close()
+
+
+@pytest.mark.unit
+class TestReportsCurrent:
+    """Test the report manifest check used to skip unchanged analyses."""
+
+    def test_matching_signature_with_reports_is_current(self, tmp_path):
+        """Test that reports built from the same source data are skipped."""
+        (tmp_path / 'cancellation_rate.csv').write_text('cancellation_rate\n0.5\n')
+        signature = {'grid_generation_queue': '2024-01-08', 'db_mtime': 1.0}
+        manifest = {'cancellation_rate': dict(signature)}
+
+        with patch('analyze_queue.REPORTS_DIR', str(tmp_path)):
+            assert _reports_current(manifest, 'cancellation_rate', signature)
+            assert not _reports_current(
+                manifest, 'cancellation_rate', {**signature, 'db_mtime': 2.0}
+            )
+
+    def test_missing_report_is_not_current(self, tmp_path):
+        """Test that a deleted report forces its analysis to rerun."""
+        signature = {'grid_generation_queue': '2024-01-08', 'db_mtime': 1.0}
+        manifest = {'cancellation_rate': dict(signature)}
+
+        with patch('analyze_queue.REPORTS_DIR', str(tmp_path)):
+            assert not _reports_current(manifest, 'cancellation_rate', signature)
+
+
+@pytest.mark.integration
+class TestMainManifest:
+    """Test that main() only records analyses whose reports it rewrote."""
+
+    def test_failed_rerun_is_not_skipped_next_time(self, temp_db, tmp_path, capsys):
+        """Test that a failure after a successful run drops the stale timeline reports."""
+        conn = sqlite3.connect(temp_db)
+        pd.DataFrame({
+            'project_name': ['Solar A', 'Wind B'],
+            'queue_position': ['Q001', 'Q002'],
+            'fuel_types': ['Solar', 'Wind'],
+            'proposed_online_date': ['2025-01-01', '2025-06-01'],
+            'current_online_date': ['2025-03-01', '2025-06-01'],
+            'ingestion_date': ['2025-01-01'] * 2,
+        }).to_sql('grid_generation_queue', conn, index=False)
+        for table in ('completed_projects', 'withdrawn_projects'):
+            pd.DataFrame({'ingestion_date': ['2025-01-01']}).to_sql(table, conn, index=False)
+        conn.close()
+        timeline_reports = [
+            tmp_path / 'project_timeline_delays.csv',
+            tmp_path / 'timeline_delay_summary.csv',
+            tmp_path / 'timeline_delay_by_fuel.csv',
+        ]
+
+        with patch('analyze_queue.DB_FILE', temp_db), \
+                patch('analyze_queue.REPORTS_DIR', str(tmp_path)):
+            main()
+            assert all(path.exists() for path in timeline_reports)
+            assert 'timeline_delay_analysis' in _load_manifest()
+
+            conn = sqlite3.connect(temp_db)
+            conn.execute(
+                "ALTER TABLE grid_generation_queue RENAME COLUMN proposed_online_date TO proposed"
+            )
+            conn.commit()
+            conn.close()
+            main()
+            assert not any(path.exists() for path in timeline_reports)
+            assert 'timeline_delay_analysis' not in _load_manifest()
+
+            capsys.readouterr()
+            main()
+            output = capsys.readouterr().out
+            assert 'Running analysis: timeline_delay_analysis' in output
+            assert 'Skipping analysis: timeline_delay_analysis' not in output
+
+
 @pytest.mark.unit
 class TestAnalysisConfiguration:
     """Test configuration and constants in analyze_queue."""
@@ -1,11 +1,16 @@
 """
 Tests for dashboard.data_loader module.
 """
+import os
 import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
+import pytest
 
-from dashboard.data_loader import DataLoader
+from dashboard import data_loader
+from dashboard.data_loader import DEFAULT_PROJECT_COLUMNS, DataLoader
 
 
 def _seed_dashboard_tables(db_path):
@@ -39,24 +44,429 @@ def _seed_dashboard_tables(db_path):
 
 def test_get_study_processes_includes_cluster_15_and_sorts_clusters(temp_db):
     _seed_dashboard_tables(temp_db)
-    loader = DataLoader(db_path=temp_db)
+    with DataLoader(db_path=temp_db) as loader:
 
-    study_processes = loader.get_study_processes()
+        study_processes = loader.get_study_processes()
 
-    assert "C15" in study_processes
-    assert study_processes.index("C14") < study_processes.index("C15")
-    assert study_processes.index("C15") < study_processes.index("TC")
+        assert "C15" in study_processes
+        assert study_processes.index("C14") < study_processes.index("C15")
+        assert study_processes.index("C15") < study_processes.index("TC")
 
 
 def test_filtered_metrics_return_zero_values_for_empty_cluster(temp_db):
     _seed_dashboard_tables(temp_db)
-    loader = DataLoader(db_path=temp_db)
+    with DataLoader(db_path=temp_db) as loader:
 
-    status_df = loader.project_count_by_status(study_processes=["C15"])
-    cancellation_df = loader.cancellation_rate(study_processes=["C15"])
-    lead_time_df = loader.average_lead_time(study_processes=["C15"])
+        status_df = loader.project_count_by_status(study_processes=["C15"])
+        cancellation_df = loader.cancellation_rate(study_processes=["C15"])
+        lead_time_df = loader.average_lead_time(study_processes=["C15"])
 
-    assert status_df["project_count"].sum() == 0
-    assert status_df["total_mw"].sum() == 0
-    assert cancellation_df["cancellation_rate"].iloc[0] == 0
-    assert lead_time_df["average_lead_time_days"].iloc[0] == 0
+        assert status_df["project_count"].sum() == 0
+        assert status_df["total_mw"].sum() == 0
+        assert cancellation_df["cancellation_rate"].iloc[0] == 0
+        assert lead_time_df["average_lead_time_days"].iloc[0] == 0
+
+
+def _seed_project_tables(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        pd.DataFrame(
+            {
+                "project_name": ["Sunny Acres", "Windy Ridge", "Battery Park"],
+                "study_process": ["C14", "C14", "C15"],
+                "county": ["KERN", "RIVERSIDE", "KERN"],
+                "state": ["CA", "CA", "CA"],
+                "fuel_types": ["Solar/Battery", "Wind Turbine", "Battery"],
+                "net_mw": [100.0, 250.0, None],
+            }
+        ).to_sql("grid_generation_queue", conn, if_exists="replace", index=False)
+
+        pd.DataFrame(
+            {
+                "project_name": ["Old Solar"],
+                "study_process": ["C02"],
+                "county": ["FRESNO"],
+                "state": ["CA"],
+                "fuel_types": ["Solar"],
+                "net_mw": [50.0],
+            }
+        ).to_sql("completed_projects", conn, if_exists="replace", index=False)
+
+        pd.DataFrame(
+            {
+                "project_name": ["Gone 100%_Wind"],
+                "Unnamed: 6_level_0 Study\nProcess": ["C14"],
+                "county": ["KERN"],
+                "state": ["NV"],
+                "fuel_types": ["Wind Turbine"],
+                "net_mw": [75.0],
+            }
+        ).to_sql("withdrawn_projects", conn, if_exists="replace", index=False)
+    finally:
+        conn.close()
+
+
+def test_query_projects_unions_all_tables_with_status(temp_db):
+    _seed_project_tables(temp_db)
+    with DataLoader(db_path=temp_db) as loader:
+
+        df = loader.query_projects(columns=["project_name", "study_process", "status"])
+
+        assert list(df.columns) == ["project_name", "study_process", "status"]
+        assert sorted(df["status"].unique()) == ["Active", "Completed", "Withdrawn"]
+        assert df.loc[df["status"] == "Withdrawn", "study_process"].iloc[0] == "C14"
+
+
+def test_unknown_table_names_are_rejected(temp_db):
+    _seed_project_tables(temp_db)
+    with DataLoader(db_path=temp_db) as loader:
+
+        assert loader.get_table_columns("sqlite_master") == []
+        assert loader.get_all_projects(table="active' AS status --").empty
+        assert len(loader.get_all_projects(table="withdrawn", study_processes=["C14"])) == 1
+
+
+def test_missing_table_columns_are_not_cached(temp_db):
+    with DataLoader(db_path=temp_db) as loader:
+
+        assert loader.get_table_columns("completed_projects") == []
+        assert not loader._report_cache
+
+        _seed_project_tables(temp_db)
+        assert "study_process" in loader.get_table_columns("completed_projects")
+
+
+def test_get_all_projects_defaults_to_curated_columns(temp_db):
+    _seed_project_tables(temp_db)
+    with DataLoader(db_path=temp_db) as loader:
+
+        df = loader.get_all_projects()
+
+        assert list(df.columns) == list(DEFAULT_PROJECT_COLUMNS) + ["status"]
+        assert df.loc[df["status"] == "Withdrawn", "study_process"].iloc[0] == "C14"
+
+
+def test_query_projects_applies_filters_in_sql(temp_db):
+    _seed_project_tables(temp_db)
+    with DataLoader(db_path=temp_db) as loader:
+
+        df = loader.query_projects(study_processes=["C14"], fuel_tokens=["Wind"], columns=["project_name"])
+        assert sorted(df["project_name"]) == ["Gone 100%_Wind", "Windy Ridge"]
+
+        df = loader.query_projects(counties=["KERN"], states=["CA"], columns=["project_name"])
+        assert sorted(df["project_name"]) == ["Battery Park", "Sunny Acres"]
+
+        df = loader.query_projects(status="active", min_capacity=150, columns=["project_name"])
+        assert df["project_name"].tolist() == ["Windy Ridge"]
+
+        df = loader.query_projects(name_search="100%_", columns=["project_name"])
+        assert df["project_name"].tolist() == ["Gone 100%_Wind"]
+
+
+def test_query_projects_ignores_unknown_columns_and_paginates(temp_db):
+    _seed_project_tables(temp_db)
+    with DataLoader(db_path=temp_db) as loader:
+
+        df = loader.query_projects(status="active", columns=["project_name", "no_such_column"], limit=2, offset=1)
+
+        assert list(df.columns) == ["project_name"]
+        assert len(df) == 2
+
+
+def test_get_distinct_values_respects_study_filter(temp_db):
+    _seed_project_tables(temp_db)
+    with DataLoader(db_path=temp_db) as loader:
+
+        assert loader.get_distinct_values("state") == ["CA", "NV"]
+        assert loader.get_distinct_values("county", study_processes=["C14"]) == ["KERN", "RIVERSIDE"]
+        assert loader.get_distinct_values("no_such_column") == []
+
+
+def test_overview_metrics_match_individual_queries(temp_db):
+    _seed_dashboard_tables(temp_db)
+    with DataLoader(db_path=temp_db) as loader:
+
+        for study_processes in (None, ["C01", "C03"], ["C15"]):
+            overview = loader.overview_metrics(study_processes=study_processes)
+            status_df = loader.project_count_by_status(study_processes=study_processes)
+
+            assert overview["status"].tolist() == status_df["status"].tolist()
+            assert overview["project_count"].tolist() == status_df["project_count"].tolist()
+            assert overview["total_mw"].tolist() == status_df["total_mw"].tolist()
+            assert overview["cancellation_rate"].iloc[0] == (
+                loader.cancellation_rate(study_processes=study_processes)["cancellation_rate"].iloc[0]
+            )
+            assert overview["average_lead_time_days"].iloc[0] == (
+                loader.average_lead_time(study_processes=study_processes)["average_lead_time_days"].iloc[0]
+            )
+
+
+def test_capacity_by_fuel_applies_fuel_contains_in_sql(temp_db):
+    _seed_project_tables(temp_db)
+    with DataLoader(db_path=temp_db) as loader:
+
+        df = loader.capacity_by_fuel(fuel_contains=["Battery"])
+        assert sorted(df["fuel"]) == ["Battery", "Solar/Battery"]
+
+        df = loader.capacity_by_fuel(study_processes=["C14"], fuel_contains=["Battery", "Wind"])
+        assert sorted(df["fuel"]) == ["Solar/Battery", "Wind Turbine"]
+
+
+def test_get_active_projects_selects_only_known_columns(temp_db):
+    _seed_project_tables(temp_db)
+    with DataLoader(db_path=temp_db) as loader:
+
+        df = loader.get_active_projects(columns=["project_name", "net_mw", "no_such_column"])
+
+        assert list(df.columns) == ["project_name", "net_mw"]
+        assert len(df) == 3
+        assert df["net_mw"].dtype == "double[pyarrow]"
+
+        df = loader.get_active_projects(columns=["project_name"], study_processes=["C15"])
+
+        assert df["project_name"].tolist() == ["Battery Park"]
+
+
+def test_get_all_projects_projects_columns_across_tables(temp_db):
+    _seed_project_tables(temp_db)
+    with DataLoader(db_path=temp_db) as loader:
+
+        df = loader.get_all_projects(columns=["project_name", "study_process"])
+
+        assert list(df.columns) == ["project_name", "study_process", "status"]
+        assert df.loc[df["status"] == "Withdrawn", "study_process"].iloc[0] == "C14"
+
+
+def test_get_all_projects_reads_in_chunks(temp_db):
+    _seed_project_tables(temp_db)
+    with DataLoader(db_path=temp_db) as loader:
+
+        chunked = loader.get_all_projects(columns=["project_name", "study_process"], chunksize=2)
+        whole = loader.get_all_projects(columns=["project_name", "study_process"])
+
+        pd.testing.assert_frame_equal(chunked, whole)
+        assert chunked["study_process"].dtype == "category"
+
+
+def test_get_all_projects_chunked_read_errors_return_empty_frame(temp_db):
+    _seed_project_tables(temp_db)
+    with DataLoader(db_path=temp_db) as loader:
+        conn = sqlite3.connect(temp_db)
+        conn.execute("DROP TABLE completed_projects")
+        conn.close()
+
+        assert loader.get_all_projects(table="completed", chunksize=2).empty
+
+
+def test_unfiltered_status_totals_read_the_summary_table(temp_db):
+    _seed_dashboard_tables(temp_db)
+    conn = sqlite3.connect(temp_db)
+    pd.DataFrame(
+        {
+            "status": ["Active", "Completed", "Withdrawn"],
+            "project_count": [30, 10, 60],
+            "total_mw": [300.0, 100.0, 600.0],
+        }
+    ).to_sql("agg_status", conn, index=False)
+    conn.close()
+    with DataLoader(db_path=temp_db) as loader:
+
+        assert loader.project_count_by_status()["project_count"].tolist() == [30, 10, 60]
+        assert loader.overview_metrics()["cancellation_rate"].iloc[0] == 0.6
+        # Filtered totals still come from the project tables
+        assert loader.project_count_by_status(study_processes=["C01"])["project_count"].tolist() == [1, 0, 0]
+
+
+def test_queries_reuse_pooled_connections(temp_db):
+    _seed_dashboard_tables(temp_db)
+    with DataLoader(db_path=temp_db) as loader:
+
+        with loader._checkout() as first:
+            pass
+        loader.overview_metrics()
+        with loader._checkout() as second:
+            pass
+
+        assert second is first
+        loader.close()
+        assert loader._pool.empty()
+
+
+def test_pooled_connections_are_read_only(temp_db):
+    _seed_dashboard_tables(temp_db)
+    with DataLoader(db_path=temp_db) as loader:
+
+        with loader._checkout() as conn:
+            assert conn.execute("PRAGMA query_only").fetchone()[0] == 1
+            assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2
+
+
+def test_report_results_are_cached_until_the_database_changes(temp_db):
+    _seed_dashboard_tables(temp_db)
+    with DataLoader(db_path=temp_db) as loader:
+
+        first = loader.project_count_by_status()
+        first.loc[0, "project_count"] = -1
+        assert loader.project_count_by_status()["project_count"].tolist() == [3, 1, 1]
+
+        conn = sqlite3.connect(temp_db)
+        conn.execute("DELETE FROM completed_projects")
+        conn.commit()
+        conn.close()
+        os.utime(temp_db, (0, loader.data_version() + 1))
+        assert loader.project_count_by_status()["project_count"].tolist() == [3, 0, 1]
+
+
+def test_average_lead_time_is_computed_in_whole_days(temp_db):
+    _seed_dashboard_tables(temp_db)
+    with DataLoader(db_path=temp_db) as loader:
+
+        assert loader.average_lead_time()["average_lead_time_days"].iloc[0] == 31
+
+
+def test_get_project_locations_cleans_counties_and_drops_missing_coordinates(temp_db):
+    conn = sqlite3.connect(temp_db)
+    pd.DataFrame(
+        {
+            "project_name": ["A", "B", "C"],
+            "county": ["KERN COUNTY ", "Fresno County", "IMPERIAL"],
+            "state": ["CA", "CA", "CA"],
+            "net_mw": [1.0, 2.0, 3.0],
+            "latitude": ["35.3", "36.7", None],
+            "longitude": ["-118.9", "-119.8", "-115.5"],
+        }
+    ).to_sql("grid_generation_queue", conn, index=False)
+    conn.close()
+    with DataLoader(db_path=temp_db) as loader:
+
+        df = loader.get_project_locations(status="active")
+
+        assert df["county"].tolist() == ["KERN", "Fresno"]
+        assert df["latitude"].dtype == "float32"
+        assert df["latitude"].tolist() == pytest.approx([35.3, 36.7])
+
+
+def test_get_project_locations_county_only_aggregates_in_sql(temp_db):
+    conn = sqlite3.connect(temp_db)
+    pd.DataFrame(
+        {
+            "project_name": ["A", "B", "C"],
+            "county": ["Kern County", "Kern", "Fresno"],
+            "state": ["CA", "CA", "CA"],
+            "net_mw": [1.0, 2.0, 4.0],
+            "latitude": ["35.3", "35.3", "36.7"],
+            "longitude": ["-118.9", "-118.9", "-119.8"],
+        }
+    ).to_sql("grid_generation_queue", conn, index=False)
+    conn.close()
+    with DataLoader(db_path=temp_db) as loader:
+
+        df = loader.get_project_locations(status="active", county_only=True).sort_values("county")
+
+        assert df["county"].tolist() == ["Fresno", "Kern"]
+        assert df["project_count"].tolist() == [1, 2]
+        assert df["total_capacity"].tolist() == [4.0, 3.0]
+
+
+def test_report_cache_ignores_filter_order(temp_db):
+    _seed_dashboard_tables(temp_db)
+    with DataLoader(db_path=temp_db) as loader:
+
+        loader.project_count_by_status(study_processes=["C14", "C01"])
+        loader.project_count_by_status(study_processes=["C01", "C14"])
+        loader.project_count_by_status(study_processes=[])
+        loader.project_count_by_status()
+
+        assert len(loader._report_cache) == 2
+
+
+def test_report_cache_evicts_least_recent_and_stale_versions(temp_db, monkeypatch):
+    _seed_dashboard_tables(temp_db)
+    monkeypatch.setattr("dashboard.data_loader.REPORT_CACHE_SIZE", 2)
+    with DataLoader(db_path=temp_db) as loader:
+
+        loader.project_count_by_status(study_processes=["C01"])
+        loader.project_count_by_status(study_processes=["C14"])
+        loader.project_count_by_status(study_processes=["C01"])
+        loader.project_count_by_status(study_processes=["TC"])
+
+        assert list(loader._report_cache) == [
+            ("project_count_by_status", (frozenset(["C01"]),)),
+            ("project_count_by_status", (frozenset(["TC"]),)),
+        ]
+
+        os.utime(temp_db, (0, loader.data_version() + 1))
+        loader.project_count_by_status()
+        assert list(loader._report_cache) == [("project_count_by_status", (None,))]
+
+
+def test_report_errors_are_not_cached(temp_db):
+    _seed_dashboard_tables(temp_db)
+    with DataLoader(db_path=temp_db) as loader:
+
+        # The seeded queue has no pto_study_region column
+        assert loader.top5_iso_zones().empty
+        assert not loader._report_cache
+
+
+def test_study_process_lookup_errors_are_not_cached(temp_db):
+    _seed_dashboard_tables(temp_db)
+    conn = sqlite3.connect(temp_db)
+    conn.execute("ALTER TABLE completed_projects RENAME TO completed_backup")
+    conn.commit()
+    conn.close()
+    with DataLoader(db_path=temp_db) as loader:
+
+        assert loader.get_study_processes() == []
+        assert loader.get_study_process_summary().empty
+        assert not loader._report_cache
+
+        conn = sqlite3.connect(temp_db)
+        conn.execute("ALTER TABLE completed_backup RENAME TO completed_projects")
+        conn.commit()
+        conn.close()
+        assert "C02" in loader.get_study_processes()
+
+
+def test_prefetch_dashboard_warms_report_cache(temp_db):
+    _seed_dashboard_tables(temp_db)
+    with DataLoader(db_path=temp_db) as loader:
+
+        futures = loader.prefetch_dashboard(study_processes=["C14"])
+        prefetched = futures["overview_metrics"].result()
+        loader.close()
+
+        assert all(future.done() for future in futures.values())
+        assert ("overview_metrics", (frozenset(["C14"]),)) in loader._report_cache
+        pd.testing.assert_frame_equal(prefetched, loader.overview_metrics(study_processes=["C14"]))
+
+
+def test_concurrent_calls_share_one_running_report(temp_db, monkeypatch):
+    _seed_dashboard_tables(temp_db)
+    with DataLoader(db_path=temp_db) as loader:
+        calls = []
+        read_frame = data_loader._read_frame
+
+        def slow_read_frame(*args, **kwargs):
+            calls.append(args[0])
+            time.sleep(0.2)
+            return read_frame(*args, **kwargs)
+
+        monkeypatch.setattr(data_loader, "_read_frame", slow_read_frame)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(
+                lambda _: loader.project_count_by_status(study_processes=["C01"]), range(2)
+            ))
+
+        assert len(calls) == 1
+        pd.testing.assert_frame_equal(results[0], results[1])
+
+
+def test_prefetch_dashboard_prints_report_errors(temp_db, capsys):
+    _seed_dashboard_tables(temp_db)
+    with DataLoader(db_path=temp_db) as loader:
+
+        loader.prefetch_dashboard()
+        loader.close()
+
+        assert "Error prefetching capacity_by_fuel" in capsys.readouterr().out
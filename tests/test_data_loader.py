@@ -4,6 +4,7 @@ import sqlite3
 import pandas as pd
 import sys
 import os
+from datetime import date
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'dashboard'))
@@ -42,46 +43,46 @@ class TestCluster15DataLoader:
     """Tests for Cluster 15 DataLoader methods."""
 
     def test_get_cluster15_projects_returns_dataframe(self, db_with_cluster15):
-        loader = DataLoader(db_path=db_with_cluster15)
-        df = loader.get_cluster15_projects()
-        assert isinstance(df, pd.DataFrame)
-        assert len(df) == 3
+        with DataLoader(db_path=db_with_cluster15) as loader:
+            df = loader.get_cluster15_projects()
+            assert isinstance(df, pd.DataFrame)
+            assert len(df) == 3
 
     def test_get_cluster15_projects_has_required_columns(self, db_with_cluster15):
-        loader = DataLoader(db_path=db_with_cluster15)
-        df = loader.get_cluster15_projects()
-        required = {'queue_position', 'project_name', 'fuel_types', 'net_mw'}
-        assert required.issubset(set(df.columns))
+        with DataLoader(db_path=db_with_cluster15) as loader:
+            df = loader.get_cluster15_projects()
+            required = {'queue_position', 'project_name', 'fuel_types', 'net_mw'}
+            assert required.issubset(set(df.columns))
 
     def test_get_cluster15_summary_returns_totals(self, db_with_cluster15):
-        loader = DataLoader(db_path=db_with_cluster15)
-        summary = loader.get_cluster15_summary()
-        assert 'total_projects' in summary
-        assert 'total_mw' in summary
-        assert summary['total_projects'] == 3
-        assert summary['total_mw'] == 350.0
+        with DataLoader(db_path=db_with_cluster15) as loader:
+            summary = loader.get_cluster15_summary()
+            assert 'total_projects' in summary
+            assert 'total_mw' in summary
+            assert summary['total_projects'] == 3
+            assert summary['total_mw'] == 350.0
 
     def test_get_cluster15_capacity_by_fuel(self, db_with_cluster15):
-        loader = DataLoader(db_path=db_with_cluster15)
-        df = loader.get_cluster15_capacity_by_fuel()
-        assert isinstance(df, pd.DataFrame)
-        assert 'fuel' in df.columns
-        assert 'total_mw' in df.columns
-        assert len(df) == 3  # Solar, Wind, Storage
+        with DataLoader(db_path=db_with_cluster15) as loader:
+            df = loader.get_cluster15_capacity_by_fuel()
+            assert isinstance(df, pd.DataFrame)
+            assert 'fuel' in df.columns
+            assert 'total_mw' in df.columns
+            assert len(df) == 3  # Solar, Wind, Storage
 
     def test_get_latest_ingestion_date_includes_cluster15(self, db_with_cluster15):
-        loader = DataLoader(db_path=db_with_cluster15)
-        latest = loader.get_latest_ingestion_date()
-        assert latest is not None
+        with DataLoader(db_path=db_with_cluster15) as loader:
+            latest = loader.get_latest_ingestion_date()
+            assert latest == date(2026, 3, 23)
 
     def test_get_cluster15_projects_empty_when_no_table(self, temp_db):
-        loader = DataLoader(db_path=temp_db)
-        df = loader.get_cluster15_projects()
-        assert isinstance(df, pd.DataFrame)
-        assert len(df) == 0
+        with DataLoader(db_path=temp_db) as loader:
+            df = loader.get_cluster15_projects()
+            assert isinstance(df, pd.DataFrame)
+            assert len(df) == 0
 
     def test_get_cluster15_summary_zeros_when_no_table(self, temp_db):
-        loader = DataLoader(db_path=temp_db)
-        summary = loader.get_cluster15_summary()
-        assert summary['total_projects'] == 0
-        assert summary['total_mw'] == 0.0
+        with DataLoader(db_path=temp_db) as loader:
+            summary = loader.get_cluster15_summary()
+            assert summary['total_projects'] == 0
+            assert summary['total_mw'] == 0.0
@@ -14,6 +14,7 @@ from parse_queue import (
     get_county_coordinates,
     flatten_columns,
     parse_sheet,
+    build_status_summary,
     COUNTY_COORDS
 )
 
@@ -244,6 +245,22 @@ class TestParseQueueIntegration:
         assert len(duplicates) > 0
         assert 'Z001' in duplicates['queue_position'].values
 
+    def test_build_status_summary_totals_each_status(self, temp_db):
+        """Test that the agg_status summary table totals each project table."""
+        conn = sqlite3.connect(temp_db)
+        pd.DataFrame({'net_mw': [10.0, None]}).to_sql('grid_generation_queue', conn, index=False)
+        pd.DataFrame({'net_mw': [5.0]}).to_sql('completed_projects', conn, index=False)
+        pd.DataFrame({'net_mw': []}, dtype=float).to_sql('withdrawn_projects', conn, index=False)
+
+        build_status_summary(conn)
+        build_status_summary(conn)  # rebuilding replaces the previous table
+        summary = pd.read_sql('SELECT * FROM agg_status', conn)
+        conn.close()
+
+        assert summary['status'].tolist() == ['Active', 'Completed', 'Withdrawn']
+        assert summary['project_count'].tolist() == [2, 1, 0]
+        assert summary['total_mw'].tolist() == [10.0, 5.0, 0]
+
 
 @pytest.mark.unit
 class TestCluster15Parsing: